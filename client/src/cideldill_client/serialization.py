@@ -32,6 +32,8 @@ def set_serialization_error_reporter(
 ) -> None:
     global _reporter
     _reporter = reporter
+    # configure_picklers() skips None, so clear the shared reporter here too.
+    _common.ReportSerializationError = reporter
 
 
 def set_verbose_serialization_warnings(enabled: bool) -> None:
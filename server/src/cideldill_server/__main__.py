@@ -97,6 +97,7 @@ def _print_banner(args, db_path: str, *, out) -> None:
     print("  POST   /api/call/complete         - Complete a debug call", file=out)
     print("  GET    /api/paused                - List paused executions", file=out)
     print("  POST   /api/paused/<id>/continue  - Continue execution", file=out)
+    print("  POST   /api/paused/continue       - Continue several executions", file=out)
     print(f"\nDatabase: {db_path}", file=out)
     print("\nPress Ctrl+C to stop the server", file=out)
     print("=" * 60, file=out)
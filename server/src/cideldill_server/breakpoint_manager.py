@@ -48,9 +48,42 @@ class BreakpointManager:
         self._observers: list[Callable[[str, dict[str, object]], None]] = []
         self._com_error_limit = 500
         self._lock = threading.Lock()
+        # Signalled whenever a new paused execution is added
+        self._paused_changed = threading.Condition(self._lock)
+        self._pause_seq = 0
+        # Signalled whenever resume actions are stored
+        self._resumed = threading.Condition(self._lock)
         # Default behavior when a breakpoint is hit: "stop" or "go"
         self._default_behavior: str = "stop"
 
+    def clear(self) -> None:
+        """Reset all breakpoint, execution, and history state.
+
+        Observers stay registered and the pause sequence keeps counting up,
+        so existing ``since`` values passed to
+        :meth:`wait_for_paused_executions` remain meaningful.
+        """
+        with self._lock:
+            self._breakpoints.clear()
+            self._breakpoint_behaviors.clear()
+            self._after_breakpoint_behaviors.clear()
+            self._breakpoint_replacements.clear()
+            self._registered_functions.clear()
+            self._function_signatures.clear()
+            self._function_metadata.clear()
+            self._paused_executions.clear()
+            self._resume_actions.clear()
+            self._call_data.clear()
+            self._call_to_pause.clear()
+            self._execution_history.clear()
+            self._call_records.clear()
+            self._com_errors.clear()
+            self._object_history.clear()
+            self._repl_sessions.clear()
+            self._repl_sessions_by_pause.clear()
+            self._repl_sessions_by_call.clear()
+            self._default_behavior = "stop"
+
     @staticmethod
     def _normalize_global_behavior(behavior: str) -> str:
         aliases = {
@@ -291,6 +324,8 @@ class BreakpointManager:
                 "call_data": call_data,
                 "paused_at": paused_at,
             }
+            self._pause_seq += 1
+            self._paused_changed.notify_all()
             observers = list(self._observers)
 
         method_name = None
@@ -326,6 +361,29 @@ class BreakpointManager:
         with self._lock:
             return list(self._paused_executions.values())
 
+    def get_pause_sequence(self) -> int:
+        """Get the number of paused executions added so far.
+
+        Returns:
+            Monotonic counter incremented by every add_paused_execution call.
+        """
+        with self._lock:
+            return self._pause_seq
+
+    def wait_for_paused_executions(self, since: int, timeout: float) -> int:
+        """Block until a paused execution newer than ``since`` is added.
+
+        Args:
+            since: Pause sequence number the caller has already seen.
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            The current pause sequence number.
+        """
+        with self._paused_changed:
+            self._paused_changed.wait_for(lambda: self._pause_seq > since, timeout=timeout)
+            return self._pause_seq
+
     def resume_execution(self, pause_id: str, action: dict[str, Any]) -> None:
         """Resume a paused execution with the given action.
 
@@ -333,25 +391,38 @@ class BreakpointManager:
             pause_id: ID of the paused execution.
             action: Action dict (e.g., {"action": "continue"}).
         """
+        self.resume_executions({pause_id: action})
+
+    def resume_executions(self, actions: dict[str, dict[str, Any]]) -> None:
+        """Resume several paused executions under a single lock acquisition.
+
+        Args:
+            actions: Dict mapping pause IDs to action dicts.
+        """
+        resumed: list[tuple[str, Optional[dict[str, Any]], dict[str, Any]]] = []
         with self._lock:
-            paused = self._paused_executions.get(pause_id)
-            # Store the action
-            self._resume_actions[pause_id] = action
-            # Remove from paused list
-            self._paused_executions.pop(pause_id, None)
-            self._close_repl_sessions_for_pause(pause_id)
+            for pause_id, action in actions.items():
+                paused = self._paused_executions.get(pause_id)
+                # Store the action
+                self._resume_actions[pause_id] = action
+                # Remove from paused list
+                self._paused_executions.pop(pause_id, None)
+                self._close_repl_sessions_for_pause(pause_id)
+                resumed.append((pause_id, paused, action))
+            self._resumed.notify_all()
             observers = list(self._observers)
 
-        call_data = paused.get("call_data") if isinstance(paused, dict) else {}
-        method_name = None
-        if isinstance(call_data, dict):
-            method_name = call_data.get("method_name") or call_data.get("function_name")
-        payload = {
-            "pause_id": pause_id,
-            "method_name": method_name,
-            "action": action.get("action") if isinstance(action, dict) else None,
-        }
-        self._dispatch_observers(observers, "execution_resumed", payload)
+        for pause_id, paused, action in resumed:
+            call_data = paused.get("call_data") if isinstance(paused, dict) else {}
+            method_name = None
+            if isinstance(call_data, dict):
+                method_name = call_data.get("method_name") or call_data.get("function_name")
+            payload = {
+                "pause_id": pause_id,
+                "method_name": method_name,
+                "action": action.get("action") if isinstance(action, dict) else None,
+            }
+            self._dispatch_observers(observers, "execution_resumed", payload)
 
     def get_resume_action(self, pause_id: str) -> Optional[dict[str, Any]]:
         """Get the resume action for a paused execution.
@@ -377,10 +448,23 @@ class BreakpointManager:
         client_ref: int | str,
         snapshot: dict[str, Any],
     ) -> None:
-        key = (process_key, client_ref)
+        self.record_object_snapshots(process_key, [(client_ref, snapshot)])
+
+    def record_object_snapshots(
+        self,
+        process_key: str,
+        snapshots: list[tuple[int | str, dict[str, Any]]],
+    ) -> None:
+        """Record snapshots for several client refs under a single lock acquisition.
+
+        Args:
+            process_key: Key of the process that owns the objects.
+            snapshots: ``(client_ref, snapshot)`` pairs, in order.
+        """
         with self._lock:
-            history = self._object_history.setdefault(key, [])
-            history.append(dict(snapshot))
+            for client_ref, snapshot in snapshots:
+                history = self._object_history.setdefault((process_key, client_ref), [])
+                history.append(dict(snapshot))
 
     def get_object_history(self, process_key: str, client_ref: int | str) -> list[dict[str, Any]]:
         key = (process_key, client_ref)
@@ -407,14 +491,26 @@ class BreakpointManager:
         pause_id: str,
         timeout: float = 30.0,
         poll_interval: float = 0.05,
+        *,
+        consume: bool = True,
     ) -> Optional[dict[str, Any]]:
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            action = self.pop_resume_action(pause_id)
-            if action is not None:
-                return action
-            time.sleep(poll_interval)
-        return None
+        """Block until a resume action is stored for a paused execution.
+
+        Args:
+            pause_id: ID of the paused execution.
+            timeout: Maximum number of seconds to wait.
+            poll_interval: Deprecated and ignored; waiters are woken as soon
+                as the action is stored. Kept so existing callers still work.
+            consume: Pop the action when True, otherwise leave it in place.
+
+        Returns:
+            Resume action dict, or None if the wait timed out.
+        """
+        with self._resumed:
+            self._resumed.wait_for(lambda: pause_id in self._resume_actions, timeout=timeout)
+            if consume:
+                return self._resume_actions.pop(pause_id, None)
+            return self._resume_actions.get(pause_id)
 
     def set_default_behavior(self, behavior: str) -> None:
         """Set the default behavior when a breakpoint is hit.
@@ -517,22 +613,32 @@ class BreakpointManager:
 
     def record_call(self, call_record: dict[str, Any]) -> None:
         """Record a completed call for call tree views."""
+        self.record_calls([call_record])
+
+    def record_calls(self, call_records: list[dict[str, Any]]) -> None:
+        """Record several completed calls under a single lock acquisition.
+
+        Args:
+            call_records: Call records to append, in order.
+        """
         with self._lock:
-            call_id = call_record.get("call_id")
-            if call_id:
-                call_record.setdefault(
-                    "repl_sessions",
-                    list(self._repl_sessions_by_call.get(call_id, [])),
-                )
-            self._call_records.append(call_record)
+            for call_record in call_records:
+                call_id = call_record.get("call_id")
+                if call_id:
+                    call_record.setdefault(
+                        "repl_sessions",
+                        list(self._repl_sessions_by_call.get(call_id, [])),
+                    )
+                self._call_records.append(call_record)
             observers = list(self._observers)
 
-        payload = {
-            "call_id": call_record.get("call_id"),
-            "method_name": call_record.get("method_name"),
-            "status": call_record.get("status"),
-        }
-        self._dispatch_observers(observers, "call_completed", payload)
+        for call_record in call_records:
+            payload = {
+                "call_id": call_record.get("call_id"),
+                "method_name": call_record.get("method_name"),
+                "status": call_record.get("status"),
+            }
+            self._dispatch_observers(observers, "call_completed", payload)
 
     def get_call_records(self) -> list[dict[str, Any]]:
         """Get all recorded calls."""
@@ -29,13 +29,18 @@ from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler, make_server
 from .breakpoint_manager import BreakpointManager
 from .cid_store import CIDStore
 from .debug_client_js import render_debug_client_js
+from .json_provider import OrjsonProvider
 from .port_discovery import get_discovery_file_path, write_port_file
+from .process_key import make_process_key
 from .serialization import Serializer, deserialize
 
 # Configure Flask's logging to suppress request spam by default
 log = logging.getLogger('werkzeug')
 log.setLevel(logging.WARNING)
 
+# Upper bound for the long-poll wait on GET /api/paused and GET /api/poll/<id>
+_MAX_LONG_POLL_WAIT_S = 30.0
+
 
 # HTML template for the web UI
 HTML_TEMPLATE = """
@@ -1033,7 +1038,9 @@ class BreakpointServer:
         self.actual_port = port
         self.host = host
         self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
         self._running = False
+        self._ready = threading.Event()
         self._server: BaseWSGIServer | None = None
         self._cid_store = CIDStore(db_path)
         self._call_seq = 0
@@ -1045,6 +1052,8 @@ class BreakpointServer:
         self._repl_eval_waiters: dict[str, dict[str, object]] = {}
         self.port_file = port_file or get_discovery_file_path()
         self._log_stream = log_stream
+        # HTML_TEMPLATE takes no per-request inputs; it is rendered on first use
+        self._index_html: str | None = None
         self._setup_routes()
 
     def queue_repl_eval(self, pause_id: str, session_id: str, expr: str) -> str:
@@ -1645,6 +1654,7 @@ class BreakpointServer:
             kwargs: dict[str, object],
         ) -> None:
             timestamp = time.time()
+            snapshots: list[tuple[int | str, dict[str, object]]] = []
 
             def record_item(
                 item: dict[str, object],
@@ -1668,7 +1678,7 @@ class BreakpointServer:
                     snapshot["index"] = index
                 if key is not None:
                     snapshot["key"] = key
-                self.manager.record_object_snapshot(process_key, client_ref, snapshot)
+                snapshots.append((client_ref, snapshot))
 
             if isinstance(target, dict):
                 record_item(target, "target")
@@ -1678,6 +1688,8 @@ class BreakpointServer:
             for key, item in kwargs.items():
                 if isinstance(item, dict):
                     record_item(item, "kwarg", key=key)
+            if snapshots:
+                self.manager.record_object_snapshots(process_key, snapshots)
 
         def _record_completion_snapshot(
             *,
@@ -1843,7 +1855,7 @@ class BreakpointServer:
                 start = float(process_start_time)
             except (TypeError, ValueError):
                 return None
-            return f"{start:.6f}+{pid}"
+            return make_process_key(pid, start)
 
         def _openapi_spec() -> dict[str, object]:
             any_object_schema = {"type": "object", "additionalProperties": True}
@@ -1887,7 +1899,8 @@ class BreakpointServer:
                     "version": "1.0.0",
                     "description": (
                         "OpenAPI definition for breakpoint management, paused execution "
-                        "control, and REPL APIs."
+                        "control, and REPL APIs. JSON responses encode non-finite floats "
+                        "(NaN, Infinity, -Infinity) as null."
                     ),
                 },
                 "servers": [
@@ -1968,6 +1981,9 @@ class BreakpointServer:
                             "responses": {"200": success_response},
                         },
                     },
+                    "/api/paused/continue": {
+                        "post": _with_json_body("Resume several paused executions"),
+                    },
                     "/api/paused/{pause_id}/continue": {
                         "post": {
                             **_with_json_body("Resume a paused execution"),
@@ -2111,7 +2127,9 @@ class BreakpointServer:
         @self.app.route('/')
         def index():
             """Serve the main web UI."""
-            return render_template_string(HTML_TEMPLATE)
+            if self._index_html is None:
+                self._index_html = render_template_string(HTML_TEMPLATE)
+            return self._index_html
 
         @self.app.route('/api/report-com-error', methods=['POST'])
         def report_com_error():
@@ -5509,8 +5527,17 @@ class BreakpointServer:
             fails after the server responds, the client can retry and still
             get the same resume action. The action is cleaned up when the
             call completes.
+
+            With a ``wait`` (seconds) query parameter, block until the action
+            is stored or the wait expires instead of answering immediately.
             """
-            action = self.manager.get_resume_action(pause_id)
+            wait = request.args.get('wait', type=float)
+            if wait and wait > 0:
+                action = self.manager.wait_for_resume_action(
+                    pause_id, timeout=min(wait, _MAX_LONG_POLL_WAIT_S), consume=False
+                )
+            else:
+                action = self.manager.get_resume_action(pause_id)
             if action is None:
                 return jsonify({"status": "waiting"})
             return jsonify({"status": "ready", "action": action})
@@ -5790,7 +5817,20 @@ class BreakpointServer:
 
         @self.app.route('/api/paused', methods=['GET'])
         def get_paused():
-            """Get all paused executions."""
+            """Get all paused executions.
+
+            With ``wait`` (seconds) and ``since`` query parameters, block until a
+            pause newer than ``since`` arrives or the wait expires. The latest
+            pause sequence number is returned in the ``X-Last-Id`` header.
+            """
+            wait = request.args.get('wait', type=float)
+            since = request.args.get('since', default=0, type=int)
+            if wait and wait > 0:
+                last_id = self.manager.wait_for_paused_executions(
+                    since, timeout=min(wait, _MAX_LONG_POLL_WAIT_S)
+                )
+            else:
+                last_id = self.manager.get_pause_sequence()
             paused = []
             for item in self.manager.get_paused_executions():
                 pause_id = item.get("id")
@@ -5800,14 +5840,15 @@ class BreakpointServer:
                 payload = dict(item)
                 payload["repl_sessions"] = repl_sessions
                 paused.append(payload)
-            return jsonify({
+            response = jsonify({
                 "paused": paused
             })
+            response.headers["X-Last-Id"] = str(last_id)
+            return response
 
-        @self.app.route('/api/paused/<pause_id>/continue', methods=['POST'])
-        def continue_execution(pause_id):
-            """Continue a paused execution."""
-            data = request.get_json() or {}
+        def _build_resume_action(
+            pause_id: str, data: dict[str, object]
+        ) -> tuple[dict[str, object], dict[str, object] | None]:
             action = data.get('action', 'continue')
             replacement_function = data.get('replacement_function')
             paused = self.manager.get_paused_execution(pause_id) or {}
@@ -5816,6 +5857,7 @@ class BreakpointServer:
             if isinstance(call_data, dict):
                 preferred_format = call_data.get("preferred_format", "dill")
 
+            action_dict: dict[str, object]
             if replacement_function:
                 action_dict = {
                     "action": "replace",
@@ -5843,6 +5885,37 @@ class BreakpointServer:
             if preferred_format not in {"dill", "json"}:
                 preferred_format = "dill"
             error = _apply_preferred_format(action_dict, preferred_format)
+            return action_dict, error
+
+        @self.app.route('/api/paused/continue', methods=['POST'])
+        def continue_executions():
+            """Continue several paused executions with one request."""
+            data = request.get_json() or {}
+            pause_ids = data.get('ids')
+            if not isinstance(pause_ids, list) or not all(
+                isinstance(pause_id, str) for pause_id in pause_ids
+            ):
+                return jsonify(
+                    _error_payload("invalid_ids", "ids must be a list of pause IDs")
+                ), 400
+
+            actions: dict[str, dict[str, object]] = {}
+            for pause_id in pause_ids:
+                action_dict, error = _build_resume_action(pause_id, data)
+                if error:
+                    return jsonify(error), 400
+                actions[pause_id] = action_dict
+
+            self.manager.resume_executions(actions)
+            for pause_id in actions:
+                _mark_repl_waiters_closed(pause_id=pause_id)
+            return jsonify({"status": "ok", "pause_ids": list(actions)})
+
+        @self.app.route('/api/paused/<pause_id>/continue', methods=['POST'])
+        def continue_execution(pause_id):
+            """Continue a paused execution."""
+            data = request.get_json() or {}
+            action_dict, error = _build_resume_action(pause_id, data)
             if error:
                 return jsonify(error), 400
 
@@ -5858,10 +5931,39 @@ class BreakpointServer:
         self._write_port_file()
         output = self._log_stream if self._log_stream is not None else sys.stdout
         print(f"Server running on http://{self.host}:{self.actual_port}", file=output)
+        self._ready.set()
         try:
             self._server.serve_forever()
         finally:
             self._running = False
+            self._ready.clear()
+
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        """Block until start() has bound the listening socket.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait forever.
+
+        Returns:
+            True if the server is ready, False if the timeout expired.
+        """
+        return self._ready.wait(timeout)
+
+    def reset(self) -> None:
+        """Return the server to its freshly constructed state without restarting it.
+
+        Clears the manager, the CID store, pending REPL evaluations and the
+        call sequence. Threads blocked on a REPL evaluation are woken before
+        its waiter is dropped.
+        """
+        self.manager.clear()
+        self._cid_store.clear()
+        self.mark_repl_waiters_closed()
+        with self._repl_lock:
+            self._repl_eval_waiters.clear()
+            self._repl_eval_queues.clear()
+        with self._call_seq_lock:
+            self._call_seq = 0
 
     def stop(self) -> None:
         """Stop the server."""
@@ -143,6 +143,12 @@ class CIDStore:
                 "size_bytes": row[1],
             }
 
+    def clear(self) -> None:
+        """Remove every stored CID mapping."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cid_data")
+            self._conn.commit()
+
     def close(self) -> None:
         """Close the underlying database connection."""
         with self._lock:
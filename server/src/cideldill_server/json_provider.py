@@ -0,0 +1,62 @@
+"""orjson-backed JSON provider for the Flask breakpoint server."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Leave dates and dataclasses to Flask's ``default``, which formats them as the stdlib provider does
+_BASE_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Encode and decode JSON with orjson, falling back to the stdlib.
+
+    orjson rejects a few inputs the stdlib accepts (integers wider than
+    64 bits, ``NaN``/``Infinity`` literals sent by Python clients), so those
+    are handed to :class:`DefaultJSONProvider` unchanged. Non-finite floats
+    are written as ``null``, which browsers can parse, unlike the stdlib's
+    bare ``NaN``/``Infinity`` literals.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string.
+
+        Args:
+            obj: Value to serialize.
+            **kwargs: Options for the stdlib fallback; ``indent`` also selects
+                orjson's two-space indentation.
+
+        Returns:
+            The JSON document.
+        """
+        option = _BASE_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize a JSON document.
+
+        Args:
+            s: JSON text or bytes.
+            **kwargs: Options for the stdlib fallback.
+
+        Returns:
+            The decoded value.
+        """
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().loads(s, **kwargs)
@@ -0,0 +1,16 @@
+"""Process key formatting shared by the server and its tests."""
+
+from __future__ import annotations
+
+
+def make_process_key(pid: int, start_time: float) -> str:
+    """Build the key that identifies a client process.
+
+    Args:
+        pid: Process ID reported by the client.
+        start_time: Process start time reported by the client, in seconds.
+
+    Returns:
+        The key in ``"<start_time:.6f>+<pid>"`` form.
+    """
+    return f"{start_time:.6f}+{pid}"
@@ -7,10 +7,31 @@ import pytest
 import importlib
 
 import cideldill_client.function_registry as function_registry
+from cideldill_client.serialization import set_serialization_error_reporter
 
 with_debug_module = importlib.import_module("cideldill_client.with_debug")
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --run-slow command line option."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip tests marked as slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture(autouse=True)
 def _reset_debug_state() -> None:
     """Reset global debug state between tests."""
@@ -28,6 +49,7 @@ def _reset_debug_state() -> None:
     with_debug_module._state.deadlock_watchdog_timeout_s = None
     with_debug_module._state.deadlock_watchdog_log_interval_s = None
     function_registry.clear_registry()
+    set_serialization_error_reporter(None)
     yield
     existing_client = with_debug_module._state.client
     if existing_client is not None:
@@ -43,3 +65,4 @@ def _reset_debug_state() -> None:
     with_debug_module._state.deadlock_watchdog_timeout_s = None
     with_debug_module._state.deadlock_watchdog_log_interval_s = None
     function_registry.clear_registry()
+    set_serialization_error_reporter(None)
@@ -0,0 +1,51 @@
+"""Pytest fixtures shared by the integration tests."""
+
+from __future__ import annotations
+
+import importlib
+import socket
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+from cideldill_server.breakpoint_manager import BreakpointManager
+from cideldill_server.breakpoint_server import BreakpointServer
+
+
+@pytest.fixture(scope="session")
+def sequence_demo_funcs() -> tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]]:
+    """Import the sequence_demo example once per session."""
+    sequence_demo = importlib.import_module("examples.sequence_demo")
+    return sequence_demo.whole_numbers, sequence_demo.announce_print, sequence_demo.delay_01s
+
+
+@pytest.fixture(scope="session")
+def _session_server(tmp_path_factory: pytest.TempPathFactory) -> Iterator[BreakpointServer]:
+    """Start one BreakpointServer with a bound HTTP listener per session."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+    except PermissionError:
+        pytest.skip("Socket bind not permitted in this environment")
+
+    server = BreakpointServer(
+        BreakpointManager(),
+        port=0,
+        port_file=tmp_path_factory.mktemp("running_server") / "port",
+    )
+    thread = threading.Thread(target=server.start, daemon=True)
+    thread.start()
+    if not server.wait_until_ready(timeout=5.0):
+        pytest.fail("Breakpoint server did not start within 5 seconds")
+    yield server
+    server.stop()
+    thread.join(timeout=2)
+
+
+@pytest.fixture
+def running_server(_session_server: BreakpointServer) -> BreakpointServer:
+    """Provide the session's listening server, reset to its freshly constructed state."""
+    _session_server.reset()
+    return _session_server
@@ -15,6 +15,10 @@ import pytest
 pytest.importorskip("requests")
 
 
+# Subprocess servers write the discovery file within a few hundred ms; poll finely.
+_PORT_POLL_INTERVAL_S = 0.05
+
+
 def _read_port(port_file: Path) -> Optional[int]:
     try:
         return int(port_file.read_text())
@@ -23,13 +27,12 @@ def _read_port(port_file: Path) -> Optional[int]:
 
 
 def _wait_for_port_file(port_file: Path, timeout: float = 10.0) -> int:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if port_file.exists():
-            port = _read_port(port_file)
-            if port is not None:
-                return port
-        time.sleep(0.2)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        port = _read_port(port_file)
+        if port is not None:
+            return port
+        time.sleep(_PORT_POLL_INTERVAL_S)
     raise AssertionError("Discovery file not created")
 
 
@@ -5,28 +5,16 @@ from __future__ import annotations
 import os
 import shutil
 import subprocess
-import threading
 import time
 from pathlib import Path
 
 import pytest
 import requests
 
-from cideldill_server.breakpoint_manager import BreakpointManager
 from cideldill_server.breakpoint_server import BreakpointServer
 from cideldill_server.debug_client_js import render_debug_client_js
 
 
-def _skip_if_socket_unavailable() -> None:
-    import socket
-
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.bind(("127.0.0.1", 0))
-    except PermissionError:
-        pytest.skip("Socket bind not permitted in this environment")
-
-
 def _skip_if_node_unavailable() -> None:
     if not shutil.which("node"):
         pytest.skip("node is not available")
@@ -37,34 +25,6 @@ def _skip_if_curl_unavailable() -> None:
         pytest.skip("curl is required for sync integration tests")
 
 
-def _start_server() -> tuple[BreakpointServer, threading.Thread, int]:
-    manager = BreakpointManager()
-    server = BreakpointServer(manager, port=0)
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-
-    deadline = time.monotonic() + 5.0
-    port = 0
-    while time.monotonic() < deadline:
-        if server.is_running():
-            port = server.get_port()
-            if port:
-                try:
-                    response = requests.get(
-                        f"http://localhost:{port}/api/breakpoints",
-                        timeout=1,
-                    )
-                    if response.status_code == 200:
-                        break
-                except requests.RequestException:
-                    pass
-        time.sleep(0.05)
-    else:
-        pytest.fail("Breakpoint server did not start within 5 seconds")
-
-    return server, thread, port
-
-
 def _write_debug_client(tmp_path: Path, server_url: str) -> Path:
     js_path = tmp_path / "debug-client.mjs"
     js_path.write_text(render_debug_client_js(server_url), encoding="utf-8")
@@ -129,13 +89,13 @@ globalThis.XMLHttpRequest = XMLHttpRequest;
 """
 
 
-def test_sync_browser_client_pauses_and_resumes(tmp_path: Path) -> None:
-    _skip_if_socket_unavailable()
+def test_sync_browser_client_pauses_and_resumes(
+    tmp_path: Path, running_server: BreakpointServer
+) -> None:
     _skip_if_node_unavailable()
     _skip_if_curl_unavailable()
 
-    server, thread, port = _start_server()
-    base_url = f"http://localhost:{port}"
+    base_url = f"http://localhost:{running_server.get_port()}"
     proc = None
     try:
         resp = requests.post(
@@ -182,17 +142,13 @@ if (result !== 3) throw new Error('bad result');
         if proc and proc.poll() is None:
             proc.terminate()
             proc.wait(timeout=5)
-        server.stop()
-        thread.join(timeout=2)
 
 
-def test_sync_browser_client_modify_args(tmp_path: Path) -> None:
-    _skip_if_socket_unavailable()
+def test_sync_browser_client_modify_args(tmp_path: Path, running_server: BreakpointServer) -> None:
     _skip_if_node_unavailable()
     _skip_if_curl_unavailable()
 
-    server, thread, port = _start_server()
-    base_url = f"http://localhost:{port}"
+    base_url = f"http://localhost:{running_server.get_port()}"
     proc = None
     try:
         resp = requests.post(
@@ -239,5 +195,3 @@ if (result !== 7) throw new Error('modified args not applied');
         if proc and proc.poll() is None:
             proc.terminate()
             proc.wait(timeout=5)
-        server.stop()
-        thread.join(timeout=2)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import re
 import threading
 import time
 
@@ -234,9 +233,9 @@ def test_debug_proxy_exception_search_text_includes_exception_module(monkeypatch
         response = server.test_client().get(f"/call-tree/{process_key}")
         assert response.status_code == 200
         html = response.data.decode("utf-8")
-        match = re.search(r"const data = ({.*?});", html, re.S)
-        assert match, "Expected call tree data to be embedded in HTML."
-        payload = json.loads(match.group(1))
+        start = html.find("const data = {")
+        assert start >= 0, "Expected call tree data to be embedded in HTML."
+        payload, _end = json.JSONDecoder().raw_decode(html, start + len("const data = "))
         node = payload["nodes"][-1]
         assert "psycopg2" in node["searchText"]
         assert "database role does not exist" in node["searchText"]
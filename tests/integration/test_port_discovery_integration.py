@@ -15,6 +15,12 @@ import pytest
 pytest.importorskip("requests")
 import requests
 
+from cideldill_client.with_debug import _resolve_server_url
+from cideldill_server.port_discovery import find_free_port
+
+# Subprocess servers write the discovery file within a few hundred ms; poll finely.
+_PORT_POLL_INTERVAL_S = 0.05
+
 
 def _read_port(port_file: Path) -> Optional[int]:
     try:
@@ -24,35 +30,32 @@ def _read_port(port_file: Path) -> Optional[int]:
 
 
 def _wait_for_port_file(port_file: Path, timeout: float = 10.0) -> int:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if port_file.exists():
-            port = _read_port(port_file)
-            if port is not None:
-                return port
-        time.sleep(0.5)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        port = _read_port(port_file)
+        if port is not None:
+            return port
+        time.sleep(_PORT_POLL_INTERVAL_S)
     raise AssertionError("Discovery file not created")
 
 
 def _wait_for_port_value(port_file: Path, expected: int, timeout: float = 10.0) -> int:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if port_file.exists():
-            port = _read_port(port_file)
-            if port is not None and port == expected:
-                return port
-        time.sleep(0.5)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        port = _read_port(port_file)
+        if port is not None and port == expected:
+            return port
+        time.sleep(_PORT_POLL_INTERVAL_S)
     raise AssertionError(f"Discovery file did not contain port {expected}")
 
 
 def _wait_for_port_change(port_file: Path, previous: int, timeout: float = 10.0) -> int:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if port_file.exists():
-            port = _read_port(port_file)
-            if port is not None and port != previous:
-                return port
-        time.sleep(0.5)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        port = _read_port(port_file)
+        if port is not None and port != previous:
+            return port
+        time.sleep(_PORT_POLL_INTERVAL_S)
     raise AssertionError("Discovery file did not update to a new port")
 
 
@@ -76,7 +79,14 @@ def test_server_client_discovery_workflow(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setenv("CIDELDILL_PORT_FILE", str(port_file))
 
     server_proc = subprocess.Popen(
-        [sys.executable, str(server_script), "--port", "5174"],
+        [
+            sys.executable,
+            str(server_script),
+            "--port",
+            str(find_free_port()),
+            "--db",
+            str(tmp_path / "breakpoints.sqlite3"),
+        ],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
@@ -90,8 +100,6 @@ def test_server_client_discovery_workflow(tmp_path: Path, monkeypatch) -> None:
         response = requests.get(f"http://localhost:{actual_port}/api/breakpoints", timeout=2)
         assert response.status_code == 200
 
-        from cideldill_client.with_debug import _resolve_server_url
-
         url = _resolve_server_url()
         assert f"localhost:{actual_port}" in url
     finally:
@@ -100,9 +108,6 @@ def test_server_client_discovery_workflow(tmp_path: Path, monkeypatch) -> None:
             server_proc.wait(timeout=5)
         except subprocess.TimeoutExpired:
             server_proc.kill()
-        if port_file.exists():
-            port_file.unlink()
-        monkeypatch.delenv("CIDELDILL_PORT_FILE", raising=False)
 
 
 def test_server_handles_port_conflict(tmp_path: Path, monkeypatch) -> None:
@@ -115,13 +120,18 @@ def test_server_handles_port_conflict(tmp_path: Path, monkeypatch) -> None:
     env["CIDELDILL_PORT_FILE"] = str(port_file)
     monkeypatch.setenv("CIDELDILL_PORT_FILE", str(port_file))
 
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.settimeout(0.2)
-        if sock.connect_ex(("127.0.0.1", 5174)) == 0:
-            pytest.skip("Port 5174 already in use by another process")
+    # An OS-assigned port keeps parallel workers and local servers off each other's port
+    requested_port = find_free_port()
 
     server1 = subprocess.Popen(
-        [sys.executable, str(server_script), "--port", "5174"],
+        [
+            sys.executable,
+            str(server_script),
+            "--port",
+            str(requested_port),
+            "--db",
+            str(tmp_path / "server1.sqlite3"),
+        ],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
@@ -129,9 +139,16 @@ def test_server_handles_port_conflict(tmp_path: Path, monkeypatch) -> None:
     )
 
     try:
-        _wait_for_port_value(port_file, 5174)
+        _wait_for_port_value(port_file, requested_port)
         server2 = subprocess.Popen(
-            [sys.executable, str(server_script), "--port", "5174"],
+            [
+                sys.executable,
+                str(server_script),
+                "--port",
+                str(requested_port),
+                "--db",
+                str(tmp_path / "server2.sqlite3"),
+            ],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
@@ -139,7 +156,7 @@ def test_server_handles_port_conflict(tmp_path: Path, monkeypatch) -> None:
         )
 
         try:
-            port = _wait_for_port_change(port_file, 5174)
+            port = _wait_for_port_change(port_file, requested_port)
             response = requests.get(f"http://localhost:{port}/api/breakpoints", timeout=2)
             assert response.status_code == 200
         finally:
@@ -154,12 +171,10 @@ def test_server_handles_port_conflict(tmp_path: Path, monkeypatch) -> None:
             server1.wait(timeout=5)
         except subprocess.TimeoutExpired:
             server1.kill()
-        if port_file.exists():
-            port_file.unlink()
-        monkeypatch.delenv("CIDELDILL_PORT_FILE", raising=False)
 
 
 @pytest.mark.integration
+@pytest.mark.slow
 def test_sequence_demo_uses_discovered_port(tmp_path: Path, monkeypatch) -> None:
     """Test that sequence_demo_breakpoints works with port discovery."""
     _skip_if_socket_unavailable()
@@ -200,6 +215,3 @@ def test_sequence_demo_uses_discovered_port(tmp_path: Path, monkeypatch) -> None
                 proc.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 proc.kill()
-        if port_file.exists():
-            port_file.unlink()
-        monkeypatch.delenv("CIDELDILL_PORT_FILE", raising=False)
@@ -1,10 +1,10 @@
 """Test to reproduce breakpoint stopping issue in sequence_demo."""
 
-import os
 import sys
 import threading
 import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 import requests
@@ -24,7 +24,9 @@ def _skip_if_socket_unavailable() -> None:
         pytest.skip("Socket bind not permitted in this environment")
 
 
-def test_sequence_demo_actually_stops_at_breakpoints(tmp_path: Path, monkeypatch):
+def test_sequence_demo_actually_stops_at_breakpoints(
+    tmp_path: Path, monkeypatch, sequence_demo_funcs
+):
     """Test that running sequence_demo with breakpoints actually pauses execution.
 
     This simulates what the sequence_demo_breakpoints script does and verifies
@@ -82,9 +84,14 @@ def test_sequence_demo_actually_stops_at_breakpoints(tmp_path: Path, monkeypatch
         configure_debug(server_url=f"http://localhost:{port}")
         with_debug("ON")
 
-        # Import the functions from sequence_demo
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent / "examples"))
-        from sequence_demo import whole_numbers, announce_print, delay_01s
+        whole_numbers, announce_print, delay_01s = sequence_demo_funcs
+        # delay_01s only adds wall-clock time; stub sleep for the demo module alone
+        # so the polling helpers keep their real time.sleep.
+        monkeypatch.setattr(
+            sys.modules[delay_01s.__module__],
+            "time",
+            SimpleNamespace(sleep=lambda _seconds: None),
+        )
 
         # Wrap them
         wrapped_whole = with_debug(whole_numbers)
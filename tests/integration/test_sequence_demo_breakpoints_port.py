@@ -41,49 +41,54 @@ def _wait_for_http_200(url: str, timeout_s: float = 10.0) -> None:
 def _wait_for_paused(port: int, timeout_s: float = 10.0) -> dict:
     url = f"http://localhost:{port}/api/paused"
     deadline = time.time() + timeout_s
+    since = "0"
     while time.time() < deadline:
-        resp = requests.get(url, timeout=1)
+        # Long-poll: the server holds the request until a new pause arrives.
+        resp = requests.get(url, params={"wait": "2", "since": since}, timeout=3)
         resp.raise_for_status()
         paused = resp.json().get("paused", [])
         if paused:
             return paused[0]
-        time.sleep(0.1)
+        since = resp.headers.get("X-Last-Id", since)
     raise AssertionError("Timed out waiting for a paused execution")
 
 
 def _drain_pauses_until_exit(proc: subprocess.Popen[str], port: int, timeout_s: float) -> None:
     deadline = time.time() + timeout_s
+    since = "0"
     while time.time() < deadline:
         if proc.poll() is not None:
             return
 
         try:
-            resp = requests.get(f"http://localhost:{port}/api/paused", timeout=1)
+            resp = requests.get(
+                f"http://localhost:{port}/api/paused",
+                params={"wait": "1", "since": since},
+                timeout=2,
+            )
             resp.raise_for_status()
             paused = resp.json().get("paused", [])
+            since = resp.headers.get("X-Last-Id", since)
         except requests.RequestException:
             if proc.poll() is not None:
                 return
             time.sleep(0.1)
             continue
         if not paused:
-            time.sleep(0.1)
             continue
 
-        for pause in paused:
-            pause_id = pause["id"]
-            cont = requests.post(
-                f"http://localhost:{port}/api/paused/{pause_id}/continue",
-                json={"action": "continue"},
-                timeout=2,
-            )
-            cont.raise_for_status()
-        time.sleep(0.05)
+        cont = requests.post(
+            f"http://localhost:{port}/api/paused/continue",
+            json={"ids": [pause["id"] for pause in paused], "action": "continue"},
+            timeout=2,
+        )
+        cont.raise_for_status()
     raise AssertionError("Timed out waiting for demo process to exit")
 
 
 @pytest.mark.integration
-def test_sequence_demo_breakpoints_custom_port_honors_breakpoints() -> None:
+@pytest.mark.slow
+def test_sequence_demo_breakpoints_custom_port_honors_breakpoints(tmp_path: Path) -> None:
     _skip_if_socket_unavailable()
     repo_root = Path(__file__).resolve().parents[2]
     runner = repo_root / "run" / "mac" / "sequence_demo_breakpoints"
@@ -92,7 +97,7 @@ def test_sequence_demo_breakpoints_custom_port_honors_breakpoints() -> None:
         port = _find_free_port()
     except PermissionError:
         pytest.skip("Socket bind not permitted in this environment")
-    port_file = Path(repo_root) / "tmp_port_file"
+    port_file = tmp_path / "port"
     env = os.environ.copy()
     env["CIDELDILL_PORT_FILE"] = str(port_file)
 
@@ -127,11 +132,11 @@ def test_sequence_demo_breakpoints_custom_port_honors_breakpoints() -> None:
                 proc.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 proc.kill()
-        port_file.unlink(missing_ok=True)
 
 
 @pytest.mark.integration
-def test_sequence_demo_direct_env_custom_port_honors_breakpoints() -> None:
+@pytest.mark.slow
+def test_sequence_demo_direct_env_custom_port_honors_breakpoints(tmp_path: Path) -> None:
     _skip_if_socket_unavailable()
     repo_root = Path(__file__).resolve().parents[2]
     server_script = repo_root / "run" / "mac" / "breakpoint_server"
@@ -141,12 +146,19 @@ def test_sequence_demo_direct_env_custom_port_honors_breakpoints() -> None:
         port = _find_free_port()
     except PermissionError:
         pytest.skip("Socket bind not permitted in this environment")
-    port_file = Path(repo_root) / "tmp_port_file"
+    port_file = tmp_path / "port"
     env = os.environ.copy()
     env["CIDELDILL_PORT_FILE"] = str(port_file)
 
     server_proc = subprocess.Popen(
-        [sys.executable, str(server_script), "--port", str(port)],
+        [
+            sys.executable,
+            str(server_script),
+            "--port",
+            str(port),
+            "--db",
+            str(tmp_path / "breakpoints.sqlite3"),
+        ],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
@@ -201,4 +213,3 @@ def test_sequence_demo_direct_env_custom_port_honors_breakpoints() -> None:
                 server_proc.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 server_proc.kill()
-        port_file.unlink(missing_ok=True)
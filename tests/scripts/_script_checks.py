@@ -0,0 +1,21 @@
+"""Shared assertions for the run/ script tests."""
+
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+
+def assert_script_ok(path: Path) -> os.stat_result:
+    """Assert that ``path`` is an existing, executable regular file.
+
+    Both checks come from a single ``stat`` call.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise AssertionError(f"Script not found at {path}") from None
+    assert stat.S_ISREG(st.st_mode), f"Script is not a regular file: {path}"
+    assert st.st_mode & 0o111, f"Script is not executable: {path}"
+    return st
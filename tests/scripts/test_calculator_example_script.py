@@ -8,20 +8,63 @@ This test suite validates that the calculator_example script:
 5. Can open a browser to view the results
 """
 
-import os
+import re
+import runpy
+import sqlite3
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
+from tests.scripts._script_checks import assert_script_ok
 
-@pytest.fixture
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_SCRIPT = _REPO_ROOT / "run" / "mac" / "calculator_example"
+
+_HELP_TOKENS = (b"calculator", b"--no-browser")
+_HTML_TOKENS = ("<html", "calculator", "function")
+
+
+class ScriptArtifacts(NamedTuple):
+    """Files produced by a single calculator_example run."""
+
+    db_path: Path
+    html_path: Path
+    html_content: str
+    html_lower: str
+    tables: set[str]
+    counts: dict[str, int]
+
+
+def _run_script(
+    script_path: Path, *args: str, timeout: float = 5, capture_stdout: bool = False
+) -> subprocess.CompletedProcess[bytes]:
+    """Run the script as a subprocess, failing the test as soon as it errors.
+
+    Stdout is discarded unless ``capture_stdout`` is set; stderr is always kept
+    for the failure message. Output is left as bytes; callers match byte tokens.
+    """
+    try:
+        return subprocess.run(
+            [str(script_path), *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+            check=True
+        )
+    except subprocess.CalledProcessError as exc:
+        stderr = exc.stderr.decode("utf-8", errors="replace")
+        pytest.fail(f"Script failed with exit code {exc.returncode}: {stderr}")
+
+
+@pytest.fixture(scope="session")
 def run_script_path():
     """Return the path to the calculator_example script."""
-    repo_root = Path(__file__).parent.parent.parent
-    script_path = repo_root / "run" / "mac" / "calculator_example"
-    return script_path
+    return _SCRIPT
 
 
 @pytest.fixture
@@ -31,111 +74,103 @@ def temp_output_dir():
         yield Path(tmpdir)
 
 
-def test_script_exists(run_script_path):
-    """Test that the calculator_example script exists."""
-    assert run_script_path.exists(), f"Script not found at {run_script_path}"
-
-
-def test_script_is_executable(run_script_path):
-    """Test that the calculator_example script is executable."""
-    assert os.access(run_script_path, os.X_OK), f"Script {run_script_path} is not executable"
+@pytest.fixture(scope="session")
+def script_artifacts(tmp_path_factory, run_script_path):
+    """Run the script once and share its output across tests."""
+    output_dir = tmp_path_factory.mktemp("calc")
+    db_path = output_dir / "test_calculator.db"
+    html_path = output_dir / "test_calculator.html"
+
+    # Run the script in-process rather than paying for a fresh interpreter.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CIDELDILL_SKIP_VENV_REEXEC", "1")
+        mp.setattr(sys, "path", list(sys.path))
+        mp.setattr(
+            sys,
+            "argv",
+            [
+                str(run_script_path),
+                "--no-browser",
+                "--db",
+                str(db_path),
+                "--output",
+                str(html_path),
+            ],
+        )
+        with pytest.raises(SystemExit) as exit_info:
+            runpy.run_path(str(run_script_path), run_name="__main__")
+
+    assert exit_info.value.code == 0, f"Script exited with {exit_info.value.code}"
 
+    conn = sqlite3.connect(str(db_path))
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = {row[0] for row in cursor.fetchall()}
+        counts: dict[str, int] = {}
+        if "call_records" in tables:
+            cursor.execute(
+                "SELECT function_name, COUNT(*) FROM call_records GROUP BY function_name"
+            )
+            counts = dict(cursor.fetchall())
+    finally:
+        conn.close()
 
-def test_script_runs_without_browser(run_script_path, temp_output_dir):
-    """Test that the script runs successfully without opening a browser."""
-    # Run script with --no-browser flag to avoid opening browser during tests
-    db_path = temp_output_dir / "test_calculator.db"
-    html_path = temp_output_dir / "test_calculator.html"
-
-    result = subprocess.run(
-        [str(run_script_path), "--no-browser", "--db", str(db_path), "--output", str(html_path)],
-        capture_output=True,
-        text=True,
-        timeout=10
+    html_content = html_path.read_text()
+    return ScriptArtifacts(
+        db_path, html_path, html_content, html_content.lower(), tables, counts
     )
 
-    assert result.returncode == 0, f"Script failed with stderr: {result.stderr}"
-    assert db_path.exists(), f"Database not created at {db_path}"
-    assert html_path.exists(), f"HTML output not created at {html_path}"
 
+def test_script_present_and_executable(run_script_path):
+    """Test that the calculator_example script exists and is executable."""
+    assert_script_ok(run_script_path)
 
-def test_script_creates_database_with_calculator_data(run_script_path, temp_output_dir):
-    """Test that the script creates a database with calculator execution records."""
-    db_path = temp_output_dir / "test_calculator.db"
-    html_path = temp_output_dir / "test_calculator.html"
-
-    # Run script
-    subprocess.run(
-        [str(run_script_path), "--no-browser", "--db", str(db_path), "--output", str(html_path)],
-        capture_output=True,
-        text=True,
-        timeout=10,
-        check=True
-    )
 
-    # Verify database contains calculator data
-    import sqlite3
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
+def test_script_runs_without_browser(script_artifacts):
+    """Test that the script runs successfully without opening a browser."""
+    assert script_artifacts.db_path.exists(), f"Database not created at {script_artifacts.db_path}"
+    assert script_artifacts.html_path.exists(), \
+        f"HTML output not created at {script_artifacts.html_path}"
+
 
+def test_script_creates_database_with_calculator_data(script_artifacts):
+    """Test that the script creates a database with calculator execution records."""
     # Check that call_records table exists and has data
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='call_records'")
-    assert cursor.fetchone() is not None, "call_records table not found"
+    assert "call_records" in script_artifacts.tables, "call_records table not found"
 
     # Check that we have calculator function calls recorded
-    cursor.execute("SELECT COUNT(*) FROM call_records")
-    count = cursor.fetchone()[0]
-    assert count > 0, "No call records found in database"
+    assert sum(script_artifacts.counts.values()) > 0, "No call records found in database"
 
     # Check that we have add, mul, div function calls
-    cursor.execute("SELECT DISTINCT function_name FROM call_records ORDER BY function_name")
-    function_names = [row[0] for row in cursor.fetchall()]
+    function_names = script_artifacts.counts.keys()
     assert "add" in function_names, "No 'add' function calls found"
     assert "mul" in function_names, "No 'mul' function calls found"
     assert "div" in function_names, "No 'div' function calls found"
 
-    conn.close()
 
-
-def test_script_generates_html_viewer(run_script_path, temp_output_dir):
+def test_script_generates_html_viewer(script_artifacts):
     """Test that the script generates an HTML viewer for the database."""
-    db_path = temp_output_dir / "test_calculator.db"
-    html_path = temp_output_dir / "test_calculator.html"
-
-    # Run script
-    subprocess.run(
-        [str(run_script_path), "--no-browser", "--db", str(db_path), "--output", str(html_path)],
-        capture_output=True,
-        text=True,
-        timeout=10,
-        check=True
-    )
-
     # Verify HTML file was created and contains expected content
-    assert html_path.exists(), f"HTML file not created at {html_path}"
+    assert script_artifacts.html_path.exists(), \
+        f"HTML file not created at {script_artifacts.html_path}"
 
-    html_content = html_path.read_text()
-    assert "<html" in html_content.lower(), "HTML file doesn't contain HTML markup"
-    assert "calculator" in html_content.lower(), "HTML doesn't mention calculator"
-    assert "function" in html_content.lower(), "HTML doesn't show function information"
+    html_lower = script_artifacts.html_lower
+    missing = [token for token in _HTML_TOKENS if token not in html_lower]
+    assert not missing, f"HTML is missing expected content: {missing}"
 
     # Check that it includes call record data
-    assert "add" in html_content or "mul" in html_content or "div" in html_content, \
+    assert re.search(r"\b(add|mul|div)\b", html_lower), \
         "HTML doesn't contain calculator function names"
 
 
 def test_script_help_flag(run_script_path):
     """Test that the script responds to --help flag."""
-    result = subprocess.run(
-        [str(run_script_path), "--help"],
-        capture_output=True,
-        text=True,
-        timeout=5
-    )
+    result = _run_script(run_script_path, "--help", timeout=3, capture_stdout=True)
 
-    assert result.returncode == 0, "Script failed with --help flag"
-    assert "calculator" in result.stdout.lower(), "Help text doesn't mention calculator"
-    assert "--no-browser" in result.stdout, "Help text doesn't document --no-browser flag"
+    lowered = result.stdout.lower()
+    missing = [token for token in _HELP_TOKENS if token not in lowered]
+    assert not missing, f"Help text is missing expected content: {missing}"
 
 
 def test_script_with_default_paths(run_script_path, temp_output_dir, monkeypatch):
@@ -143,14 +178,7 @@ def test_script_with_default_paths(run_script_path, temp_output_dir, monkeypatch
     # Change to temp directory to avoid polluting the repo
     monkeypatch.chdir(temp_output_dir)
 
-    result = subprocess.run(
-        [str(run_script_path), "--no-browser"],
-        capture_output=True,
-        text=True,
-        timeout=10
-    )
-
-    assert result.returncode == 0, f"Script failed: {result.stderr}"
+    _run_script(run_script_path, "--no-browser")
 
     # Check that default files were created in current directory
     assert (temp_output_dir / "calculator_example.db").exists(), \
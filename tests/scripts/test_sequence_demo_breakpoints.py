@@ -1,25 +1,28 @@
 """Unit tests for sequence_demo_breakpoints script."""
 
-import os
 from pathlib import Path
 
+import pytest
 
-def test_script_exists() -> None:
-    """Test that the sequence_demo_breakpoints script exists."""
-    script_path = Path(__file__).parent.parent.parent / "run" / "mac" / "sequence_demo_breakpoints"
-    assert script_path.exists(), f"Script not found at {script_path}"
+from tests.scripts._script_checks import assert_script_ok
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_SCRIPT = _REPO_ROOT / "run" / "mac" / "sequence_demo_breakpoints"
 
-def test_script_is_executable() -> None:
-    """Test that the sequence_demo_breakpoints script is executable."""
-    script_path = Path(__file__).parent.parent.parent / "run" / "mac" / "sequence_demo_breakpoints"
-    assert os.access(script_path, os.X_OK), f"Script is not executable: {script_path}"
 
+@pytest.fixture(scope="module")
+def first_line() -> str:
+    """Read the script's first line once."""
+    with open(_SCRIPT, "rb") as f:
+        return f.readline(256).decode("utf-8", errors="replace")
 
-def test_script_has_shebang() -> None:
+
+def test_script_present_and_executable() -> None:
+    """Test that the sequence_demo_breakpoints script exists and is executable."""
+    assert_script_ok(_SCRIPT)
+
+
+def test_script_has_shebang(first_line: str) -> None:
     """Test that the script has proper shebang."""
-    script_path = Path(__file__).parent.parent.parent / "run" / "mac" / "sequence_demo_breakpoints"
-    with open(script_path, "r", encoding="utf-8") as f:
-        first_line = f.readline()
     assert first_line.startswith("#!"), f"Script missing shebang: {first_line}"
     assert "python" in first_line.lower(), f"Script should use Python: {first_line}"
@@ -0,0 +1,59 @@
+"""Pytest fixtures shared by the unit tests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from cideldill_server.breakpoint_manager import BreakpointManager
+from cideldill_server.breakpoint_server import BreakpointServer
+from cideldill_server.serialization import Serializer
+from cideldill_server.serialization_common import SerializedObject
+
+
+@pytest.fixture(scope="session")
+def _session_server(tmp_path_factory: pytest.TempPathFactory) -> Iterator[BreakpointServer]:
+    """Build one BreakpointServer per session; its Flask app and routes are reused.
+
+    Tests only talk to it through ``server.test_client()``, which dispatches
+    in-process, so the server is never started.
+    """
+    server = BreakpointServer(
+        BreakpointManager(),
+        port=0,
+        port_file=tmp_path_factory.mktemp("server") / "port",
+    )
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def server(_session_server: BreakpointServer) -> BreakpointServer:
+    """Provide the session's server, reset to its freshly constructed state."""
+    _session_server.reset()
+    return _session_server
+
+
+@pytest.fixture(scope="session")
+def _session_client(_session_server: BreakpointServer):
+    """Build the shared server's Flask test client once per session."""
+    return _session_server.test_client()
+
+
+@pytest.fixture
+def client(server: BreakpointServer, _session_server: BreakpointServer, _session_client):
+    """Provide a Flask test client for ``server``.
+
+    Reuses the session client for the shared server; modules that override
+    ``server`` with their own instance get a fresh client for it.
+    """
+    if server is _session_server:
+        return _session_client
+    return server.test_client()
+
+
+@pytest.fixture(scope="session")
+def target_payload() -> SerializedObject:
+    """Serialize the ``{"x": 1}`` call target once per session."""
+    return Serializer().force_serialize_with_data({"x": 1})
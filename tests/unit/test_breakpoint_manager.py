@@ -3,47 +3,83 @@
 This test suite validates the breakpoint state management functionality.
 """
 
-import pytest
+from __future__ import annotations
 
-from cideldill_server.breakpoint_manager import BreakpointManager
+import threading
+from typing import Callable
 
+import pytest
 
-def test_can_create_breakpoint_manager() -> None:
-    """Test that BreakpointManager can be instantiated."""
-    manager = BreakpointManager()
-    assert manager is not None
+from cideldill_server.breakpoint_manager import BreakpointManager
 
 
-def test_can_add_breakpoint() -> None:
-    """Test adding a breakpoint."""
-    manager = BreakpointManager()
-    manager.add_breakpoint("my_function")
-    breakpoints = manager.get_breakpoints()
-    assert "my_function" in breakpoints
+@pytest.fixture
+def manager() -> BreakpointManager:
+    """Create a fresh BreakpointManager for each test."""
+    return BreakpointManager()
 
 
-def test_can_remove_breakpoint() -> None:
-    """Test removing a breakpoint."""
-    manager = BreakpointManager()
-    manager.add_breakpoint("my_function")
-    manager.remove_breakpoint("my_function")
-    breakpoints = manager.get_breakpoints()
-    assert "my_function" not in breakpoints
+@pytest.fixture
+def paused(manager: BreakpointManager) -> tuple[BreakpointManager, str]:
+    """Create a manager holding one paused "add" execution."""
+    pause_id = manager.add_paused_execution({"function_name": "add", "args": {"a": 1, "b": 2}})
+    return manager, pause_id
 
 
-def test_can_clear_all_breakpoints() -> None:
-    """Test clearing all breakpoints."""
+def test_can_create_breakpoint_manager() -> None:
+    """Test that BreakpointManager can be instantiated."""
     manager = BreakpointManager()
-    manager.add_breakpoint("func1")
-    manager.add_breakpoint("func2")
-    manager.clear_breakpoints()
-    breakpoints = manager.get_breakpoints()
-    assert len(breakpoints) == 0
+    assert manager is not None
 
 
-def test_can_track_paused_execution() -> None:
+@pytest.mark.parametrize(
+    ("steps", "check"),
+    [
+        pytest.param(
+            [("add_breakpoint", ("my_function",))],
+            lambda m: "my_function" in m.get_breakpoints(),
+            id="add_breakpoint",
+        ),
+        pytest.param(
+            [("add_breakpoint", ("my_function",)), ("remove_breakpoint", ("my_function",))],
+            lambda m: "my_function" not in m.get_breakpoints(),
+            id="remove_breakpoint",
+        ),
+        pytest.param(
+            [
+                ("add_breakpoint", ("func1",)),
+                ("add_breakpoint", ("func2",)),
+                ("clear_breakpoints", ()),
+            ],
+            lambda m: len(m.get_breakpoints()) == 0,
+            id="clear_breakpoints",
+        ),
+        pytest.param(
+            [("add_breakpoint", ("add",)), ("set_breakpoint_replacement", ("add", "multiply"))],
+            lambda m: m.get_breakpoint_replacement("add") == "multiply",
+            id="replacement_tracks_selection",
+        ),
+        pytest.param(
+            [("register_function", ("add", "(x: int, y: int) -> int"))],
+            lambda m: "add" in m.get_registered_functions()
+            and m.get_function_signatures()["add"] == "(x: int, y: int) -> int",
+            id="register_function_tracks_signature",
+        ),
+    ],
+)
+def test_breakpoint_operations(
+    manager: BreakpointManager,
+    steps: list[tuple[str, tuple[object, ...]]],
+    check: Callable[[BreakpointManager], bool],
+) -> None:
+    """Test that each sequence of manager calls leaves the expected state."""
+    for method, args in steps:
+        getattr(manager, method)(*args)
+    assert check(manager)
+
+
+def test_can_track_paused_execution(manager: BreakpointManager) -> None:
     """Test tracking a paused execution."""
-    manager = BreakpointManager()
     call_data = {
         "function_name": "add",
         "args": {"a": 1, "b": 2},
@@ -54,9 +90,8 @@ def test_can_track_paused_execution() -> None:
     assert len(manager.get_paused_executions()) == 1
 
 
-def test_paused_execution_has_unique_id() -> None:
+def test_paused_execution_has_unique_id(manager: BreakpointManager) -> None:
     """Test that each paused execution gets a unique ID."""
-    manager = BreakpointManager()
     call_data1 = {"function_name": "add", "args": {"a": 1, "b": 2}}
     call_data2 = {"function_name": "mul", "args": {"a": 3, "b": 4}}
 
@@ -66,9 +101,8 @@ def test_paused_execution_has_unique_id() -> None:
     assert id1 != id2
 
 
-def test_can_get_paused_execution_by_id() -> None:
+def test_can_get_paused_execution_by_id(manager: BreakpointManager) -> None:
     """Test retrieving a specific paused execution."""
-    manager = BreakpointManager()
     call_data = {"function_name": "add", "args": {"a": 1, "b": 2}}
     pause_id = manager.add_paused_execution(call_data)
 
@@ -78,9 +112,8 @@ def test_can_get_paused_execution_by_id() -> None:
     assert retrieved["call_data"]["args"] == {"a": 1, "b": 2}
 
 
-def test_can_resume_paused_execution() -> None:
+def test_can_resume_paused_execution(manager: BreakpointManager) -> None:
     """Test resuming a paused execution."""
-    manager = BreakpointManager()
     call_data = {"function_name": "add", "args": {"a": 1, "b": 2}}
     pause_id = manager.add_paused_execution(call_data)
 
@@ -92,11 +125,11 @@ def test_can_resume_paused_execution() -> None:
     assert len(manager.get_paused_executions()) == 0
 
 
-def test_can_get_resume_action_for_paused_execution() -> None:
+def test_can_get_resume_action_for_paused_execution(
+    paused: tuple[BreakpointManager, str],
+) -> None:
     """Test getting the resume action for a paused execution."""
-    manager = BreakpointManager()
-    call_data = {"function_name": "add", "args": {"a": 1, "b": 2}}
-    pause_id = manager.add_paused_execution(call_data)
+    manager, pause_id = paused
 
     # Set resume action
     action = {"action": "continue", "modified_args": {"a": 10, "b": 20}}
@@ -107,10 +140,9 @@ def test_can_get_resume_action_for_paused_execution() -> None:
     assert retrieved_action == action
 
 
-def test_pop_resume_action_removes_action() -> None:
+def test_pop_resume_action_removes_action(paused: tuple[BreakpointManager, str]) -> None:
     """Test pop_resume_action removes the stored action."""
-    manager = BreakpointManager()
-    pause_id = manager.add_paused_execution({"function_name": "add"})
+    manager, pause_id = paused
     manager.resume_execution(pause_id, {"action": "continue"})
 
     action = manager.pop_resume_action(pause_id)
@@ -118,31 +150,74 @@ def test_pop_resume_action_removes_action() -> None:
     assert manager.get_resume_action(pause_id) is None
 
 
-def test_paused_execution_includes_timestamp() -> None:
+def test_paused_execution_includes_timestamp(paused: tuple[BreakpointManager, str]) -> None:
     """Test that paused execution includes timestamp."""
-    manager = BreakpointManager()
-    call_data = {"function_name": "add", "args": {"a": 1, "b": 2}}
-    pause_id = manager.add_paused_execution(call_data)
-
+    manager, pause_id = paused
     retrieved = manager.get_paused_execution(pause_id)
     assert "paused_at" in retrieved
     assert isinstance(retrieved["paused_at"], float)
 
 
-def test_can_wait_for_resume_action() -> None:
+def test_can_wait_for_resume_action(paused: tuple[BreakpointManager, str]) -> None:
     """Test that we can wait for a resume action with timeout."""
-    manager = BreakpointManager()
-    call_data = {"function_name": "add", "args": {"a": 1, "b": 2}}
-    pause_id = manager.add_paused_execution(call_data)
+    manager, pause_id = paused
 
     # Should timeout if no action provided
-    action = manager.wait_for_resume_action(pause_id, timeout=0.1)
+    action = manager.wait_for_resume_action(pause_id, timeout=0.01)
     assert action is None
 
 
-def test_multiple_paused_executions() -> None:
+def test_wait_for_resume_action_wakes_on_resume(paused: tuple[BreakpointManager, str]) -> None:
+    """Test that waiting for a resume action returns as soon as it is stored."""
+    manager, pause_id = paused
+
+    timer = threading.Timer(
+        0.05, manager.resume_execution, args=(pause_id, {"action": "continue"})
+    )
+    timer.start()
+    try:
+        action = manager.wait_for_resume_action(pause_id, timeout=5.0, consume=False)
+    finally:
+        timer.join()
+
+    assert action == {"action": "continue"}
+    assert manager.get_resume_action(pause_id) == {"action": "continue"}
+
+
+def test_wait_for_resume_action_still_accepts_poll_interval(
+    paused: tuple[BreakpointManager, str],
+) -> None:
+    """Test that the deprecated poll_interval argument is accepted and ignored."""
+    manager, pause_id = paused
+    manager.resume_execution(pause_id, {"action": "continue"})
+
+    assert manager.wait_for_resume_action(pause_id, 1.0, 0.05) == {"action": "continue"}
+
+
+def test_wait_for_paused_executions_wakes_on_new_pause(manager: BreakpointManager) -> None:
+    """Test that waiting for paused executions returns once one is added."""
+    since = manager.get_pause_sequence()
+
+    timer = threading.Timer(0.05, manager.add_paused_execution, args=({"function_name": "add"},))
+    timer.start()
+    try:
+        last_id = manager.wait_for_paused_executions(since, timeout=5.0)
+    finally:
+        timer.join()
+
+    assert last_id == since + 1
+    assert len(manager.get_paused_executions()) == 1
+
+
+def test_wait_for_paused_executions_times_out(manager: BreakpointManager) -> None:
+    """Test that waiting for paused executions gives up after the timeout."""
+    manager.add_paused_execution({"function_name": "add"})
+
+    assert manager.wait_for_paused_executions(1, timeout=0.05) == 1
+
+
+def test_multiple_paused_executions(manager: BreakpointManager) -> None:
     """Test managing multiple paused executions simultaneously."""
-    manager = BreakpointManager()
 
     id1 = manager.add_paused_execution({"function_name": "add"})
     id2 = manager.add_paused_execution({"function_name": "mul"})
@@ -159,27 +234,26 @@ def test_multiple_paused_executions() -> None:
     assert id2 not in [p["id"] for p in paused]
 
 
-def test_register_function_tracks_signature() -> None:
-    """Registering a function should track its signature for UI matching."""
-    manager = BreakpointManager()
-    manager.register_function("add", signature="(x: int, y: int) -> int")
-
-    assert "add" in manager.get_registered_functions()
-    assert manager.get_function_signatures()["add"] == "(x: int, y: int) -> int"
+def test_can_resume_multiple_paused_executions_at_once(manager: BreakpointManager) -> None:
+    """Test resuming several paused executions in one call."""
 
+    id1 = manager.add_paused_execution({"function_name": "add"})
+    id2 = manager.add_paused_execution({"function_name": "mul"})
+    id3 = manager.add_paused_execution({"function_name": "div"})
 
-def test_breakpoint_replacement_tracks_selection() -> None:
-    """Selecting a replacement should be tracked per breakpoint."""
-    manager = BreakpointManager()
-    manager.add_breakpoint("add")
-    manager.set_breakpoint_replacement("add", "multiply")
+    manager.resume_executions({
+        id1: {"action": "continue"},
+        id3: {"action": "continue"},
+    })
 
-    assert manager.get_breakpoint_replacement("add") == "multiply"
+    paused = manager.get_paused_executions()
+    assert [p["id"] for p in paused] == [id2]
+    assert manager.get_resume_action(id1) == {"action": "continue"}
+    assert manager.get_resume_action(id3) == {"action": "continue"}
 
 
-def test_after_breakpoints_can_pause_execution() -> None:
+def test_after_breakpoints_can_pause_execution(manager: BreakpointManager) -> None:
     """After-breakpoint behaviors should control post-call pauses."""
-    manager = BreakpointManager()
     manager.add_breakpoint("add")
     manager.set_default_behavior("go")
     manager.set_after_breakpoint_behavior("add", "stop")
@@ -190,9 +264,8 @@ def test_after_breakpoints_can_pause_execution() -> None:
     assert manager.should_pause_after_breakpoint("add") is False
 
 
-def test_default_exception_behavior_pauses_only_on_exceptions() -> None:
+def test_default_exception_behavior_pauses_only_on_exceptions(manager: BreakpointManager) -> None:
     """Global exception mode should not pause at call start, only on exception return."""
-    manager = BreakpointManager()
     manager.add_breakpoint("add")
     manager.set_default_behavior("exception")
 
@@ -201,9 +274,8 @@ def test_default_exception_behavior_pauses_only_on_exceptions() -> None:
     assert manager.should_pause_after_breakpoint("add", is_exception=True) is True
 
 
-def test_after_breakpoint_defer_inherits_global_behavior() -> None:
+def test_after_breakpoint_defer_inherits_global_behavior(manager: BreakpointManager) -> None:
     """Default return handling should defer to the global behavior profile."""
-    manager = BreakpointManager()
     manager.add_breakpoint("add")
     manager.set_default_behavior("stop_exception")
 
@@ -212,9 +284,8 @@ def test_after_breakpoint_defer_inherits_global_behavior() -> None:
     assert manager.should_pause_after_breakpoint("add", is_exception=True) is True
 
 
-def test_after_breakpoint_can_stop_on_exceptions_only() -> None:
+def test_after_breakpoint_can_stop_on_exceptions_only(manager: BreakpointManager) -> None:
     """Per-function return handling should support exception-only pausing."""
-    manager = BreakpointManager()
     manager.add_breakpoint("add")
     manager.set_default_behavior("stop")
     manager.set_after_breakpoint_behavior("add", "exception")
@@ -223,9 +294,8 @@ def test_after_breakpoint_can_stop_on_exceptions_only() -> None:
     assert manager.should_pause_after_breakpoint("add", is_exception=True) is True
 
 
-def test_can_record_execution_history() -> None:
+def test_can_record_execution_history(manager: BreakpointManager) -> None:
     """Test that execution history can be recorded."""
-    manager = BreakpointManager()
     manager.record_execution("add", {"method_name": "add", "args": [1, 2]})
 
     history = manager.get_execution_history("add")
@@ -235,49 +305,39 @@ def test_can_record_execution_history() -> None:
     assert "completed_at" in history[0]
 
 
-def test_execution_history_ordered_by_time() -> None:
-    """Test that execution history is returned most recent first."""
-    import time
-
+@pytest.fixture(scope="module")
+def populated_manager() -> BreakpointManager:
+    """Create a manager with ten "add" executions recorded out of order."""
     manager = BreakpointManager()
-    manager.record_execution("add", {"call_id": 1}, completed_at=100.0)
-    time.sleep(0.01)
-    manager.record_execution("add", {"call_id": 2}, completed_at=200.0)
-    time.sleep(0.01)
-    manager.record_execution("add", {"call_id": 3}, completed_at=150.0)
-
-    history = manager.get_execution_history("add")
-    assert len(history) == 3
-    # Should be ordered by completed_at descending
-    assert history[0]["call_data"]["call_id"] == 2  # 200.0
-    assert history[1]["call_data"]["call_id"] == 3  # 150.0
-    assert history[2]["call_data"]["call_id"] == 1  # 100.0
-
-
-def test_execution_history_with_limit() -> None:
-    """Test that execution history can be limited."""
-    manager = BreakpointManager()
-    for i in range(10):
-        manager.record_execution("add", {"call_id": i}, completed_at=float(i))
-
-    history = manager.get_execution_history("add", limit=3)
-    assert len(history) == 3
-    # Most recent first
-    assert history[0]["call_data"]["call_id"] == 9
-    assert history[1]["call_data"]["call_id"] == 8
-    assert history[2]["call_data"]["call_id"] == 7
-
-
-def test_execution_history_empty_for_unknown_function() -> None:
-    """Test that execution history is empty for functions without history."""
-    manager = BreakpointManager()
-    history = manager.get_execution_history("unknown_func")
-    assert history == []
-
-
-def test_pop_call_cleans_up_associated_pause() -> None:
+    for call_id in (3, 7, 0, 9, 1, 5, 8, 2, 6, 4):
+        manager.record_execution("add", {"call_id": call_id}, completed_at=float(call_id))
+    return manager
+
+
+@pytest.mark.parametrize(
+    ("function_name", "limit", "expected_ids"),
+    [
+        # Ordered by completed_at descending, regardless of insertion order
+        ("add", None, list(range(9, -1, -1))),
+        # Limited to the most recent records
+        ("add", 3, [9, 8, 7]),
+        # Empty for functions without history
+        ("unknown_func", None, []),
+    ],
+)
+def test_execution_history_ordering_and_limit(
+    populated_manager: BreakpointManager,
+    function_name: str,
+    limit: int | None,
+    expected_ids: list[int],
+) -> None:
+    """Test that execution history is returned most recent first and can be limited."""
+    history = populated_manager.get_execution_history(function_name, limit=limit)
+    assert [record["call_data"]["call_id"] for record in history] == expected_ids
+
+
+def test_pop_call_cleans_up_associated_pause(manager: BreakpointManager) -> None:
     """Test that pop_call cleans up associated pause and resume data."""
-    manager = BreakpointManager()
 
     # Register a call and create a pause
     call_data = {"method_name": "add", "args": [1, 2]}
@@ -300,12 +360,9 @@ def test_pop_call_cleans_up_associated_pause() -> None:
     assert manager.get_resume_action(pause_id) is None
 
 
-def test_get_resume_action_is_idempotent() -> None:
+def test_get_resume_action_is_idempotent(paused: tuple[BreakpointManager, str]) -> None:
     """Test that get_resume_action can be called multiple times."""
-    manager = BreakpointManager()
-
-    call_data = {"method_name": "add", "args": [1, 2]}
-    pause_id = manager.add_paused_execution(call_data)
+    manager, pause_id = paused
     manager.resume_execution(pause_id, {"action": "continue"})
 
     # get_resume_action should return the same value on repeated calls
@@ -316,3 +373,50 @@ def test_get_resume_action_is_idempotent() -> None:
     assert action1 == {"action": "continue"}
     assert action2 == {"action": "continue"}
     assert action3 == {"action": "continue"}
+
+
+def test_clear_resets_state_but_keeps_observers(paused: tuple[BreakpointManager, str]) -> None:
+    """Test that clear() drops all state while observers stay registered."""
+    manager, _pause_id = paused
+    events: list[str] = []
+    manager.add_observer(lambda event, _payload: events.append(event))
+    manager.add_breakpoint("add")
+    manager.set_default_behavior("go")
+    manager.record_execution("add", {"method_name": "add"})
+    since = manager.get_pause_sequence()
+
+    manager.clear()
+
+    assert manager.get_breakpoints() == []
+    assert manager.get_paused_executions() == []
+    assert manager.get_execution_history("add") == []
+    assert manager.get_default_behavior() == "stop"
+    assert manager.get_pause_sequence() == since
+
+    manager.add_paused_execution({"function_name": "add"})
+    assert events
+
+
+def test_record_calls_appends_in_order_and_notifies_each(manager: BreakpointManager) -> None:
+    """Test that record_calls stores every record and dispatches one event per call."""
+    events: list[dict[str, object]] = []
+    manager.add_observer(lambda event, payload: events.append(payload))
+
+    manager.record_calls([
+        {"call_id": "1", "method_name": "add", "status": "success"},
+        {"call_id": "2", "method_name": "mul", "status": "exception"},
+    ])
+
+    assert [record["call_id"] for record in manager.get_call_records()] == ["1", "2"]
+    assert [event["call_id"] for event in events] == ["1", "2"]
+
+
+def test_record_object_snapshots_groups_by_client_ref(manager: BreakpointManager) -> None:
+    """Test that record_object_snapshots appends each snapshot to its ref's history."""
+    manager.record_object_snapshots(
+        "proc",
+        [(1, {"role": "target"}), (2, {"role": "arg"}), (1, {"role": "result"})],
+    )
+
+    assert [s["role"] for s in manager.get_object_history("proc", 1)] == ["target", "result"]
+    assert [s["role"] for s in manager.get_object_history("proc", 2)] == ["arg"]
@@ -3,10 +3,17 @@
 This test suite validates the web server API endpoints for breakpoint management.
 """
 
+from __future__ import annotations
+
+import base64
+import hashlib
 import json
 import re
 import threading
-import time
+from collections import namedtuple
+from collections.abc import Callable, Mapping
+from dataclasses import replace
+from types import MappingProxyType
 
 import pytest
 
@@ -14,19 +21,185 @@ pytest.importorskip("dill")
 
 from cideldill_server.breakpoint_manager import BreakpointManager
 from cideldill_server.breakpoint_server import BreakpointServer
+from cideldill_server.process_key import make_process_key
 from cideldill_server.serialization import Serializer
-from cideldill_server.serialization_common import UnpicklablePlaceholder
+from cideldill_server.serialization_common import SerializedObject, UnpicklablePlaceholder
+
+# Decodes the JSON literals the call-tree pages embed in their scripts
+_DECODER = json.JSONDecoder()
+
+
+def _embedded_json(page: bytes, marker: bytes) -> object:
+    """Decode the JSON literal that opens at the end of ``marker`` (e.g. ``b"const data = {"``).
+
+    Only the bytes from the literal onward are decoded, and ``raw_decode`` finds the
+    end of the literal itself, so the template's line layout does not matter.
+    """
+    start = page.find(marker)
+    assert start >= 0, f"Expected {marker!r} to be embedded in HTML."
+    value, _end = _DECODER.raw_decode(page[start + len(marker) - 1:].decode("utf-8"))
+    return value
+
+
+# Root page title, key UI elements, and behavior labels, matched in one scan
+_ROOT_PAGE_TOKENS = tuple(
+    token.encode("utf-8")
+    for token in (
+        "Interactive Breakpoints",
+        "CID el Dill",
+        "pausedExecutions",
+        "breakpointsList",
+        "selectedReplacements",
+        "breakpoint-replacement-select",
+        "isBreakpointSelectActive",
+        "sortBreakpoints",
+        "Stop at exceptions",
+        "Stop at breakpoints and exceptions",
+        "After: Defer to global default",
+        "🚦",
+    )
+)
+_ROOT_PAGE_TOKENS_RE = re.compile(b"|".join(re.escape(token) for token in _ROOT_PAGE_TOKENS))
+
+
+def _call_start_payload(**overrides: object) -> dict[str, object]:
+    """Build a /api/call/start request body; tests override what they check.
+
+    The nested values are built fresh on every call, so a test that mutates
+    its payload cannot leak into another test's.
+    """
+    return {
+        "method_name": "noop",
+        "args": [],
+        "kwargs": {},
+        "call_site": {"timestamp": 0.0},
+        "process_pid": 4242,
+        "process_start_time": 123.456,
+        **overrides,
+    }
+
+
+def _call_record(**overrides: object) -> dict[str, object]:
+    """Build a call record for BreakpointManager.record_call.
+
+    Tests override what the page under test reads; nested values are built
+    fresh on every call, like in :func:`_call_start_payload`.
+    """
+    return {
+        "method_name": "noop",
+        "status": "success",
+        "pretty_args": [],
+        "pretty_kwargs": {},
+        "signature": None,
+        "call_site": {"timestamp": 1.0, "stack_trace": []},
+        "started_at": 1.0,
+        "completed_at": 1.0,
+        **overrides,
+    }
+
+
+# Unpicklable function as a debug client reports it; tests replace() the fields they vary
+_CONFIGURED_FUNCTION_PLACEHOLDER = UnpicklablePlaceholder(
+    type_name="ConfiguredFunction",
+    module="nat.builder.workflow_builder",
+    qualname="ConfiguredFunction",
+    object_id="0x1",
+    repr_text="<ConfiguredFunction>",
+    str_text=None,
+    attributes={},
+    failed_attributes={},
+    pickle_error="TypeError: not picklable",
+    pickle_attempts=["dill.dumps: TypeError"],
+    capture_timestamp=0.0,
+    depth=0,
+    object_name="asset_tool",
+    object_path="nat.builder.workflow_builder.ConfiguredFunction",
+)
+
+# Placeholder whose attributes mix plain data with a nested unpicklable child
+_NESTED_PLACEHOLDER = replace(
+    _CONFIGURED_FUNCTION_PLACEHOLDER,
+    type_name="Container",
+    module="tests.unit.test_breakpoint_server",
+    qualname="Container",
+    object_id="0xparent",
+    repr_text="<Container>",
+    attributes={
+        "payload": {
+            "ok": {"nested": [1, 2]},
+            "bad": replace(
+                _CONFIGURED_FUNCTION_PLACEHOLDER,
+                type_name="ExplodingState",
+                module="tests.unit.test_breakpoint_server",
+                qualname="ExplodingState",
+                object_id="0xchild",
+                repr_text="<ExplodingState>",
+                pickle_error="TypeError: no state",
+                depth=1,
+                object_name="bad",
+                object_path="tests.unit.test_breakpoint_server.ExplodingState",
+            ),
+        }
+    },
+    pickle_error="TypeError: parent",
+    object_name="container_tool",
+    object_path="tests.unit.test_breakpoint_server.Container",
+)
+
+# Opaque call target for flow-control tests that never read the deserialized value;
+# the CID is still the real hash because /api/call/start verifies it
+FakeSerialized = namedtuple("FakeSerialized", "cid data_base64")
+_OPAQUE_TARGET = FakeSerialized(
+    cid=hashlib.sha512(b"t1").hexdigest(),
+    data_base64=base64.b64encode(b"t1").decode("ascii"),
+)
 
 
 @pytest.fixture
-def server():
-    """Create a test server instance."""
-    manager = BreakpointManager()
-    server = BreakpointServer(manager, port=0)  # port=0 for random available port
+def server(request, tmp_path, _session_server):
+    """Provide a test server in its freshly constructed state.
+
+    Tests only talk to it through ``server.test_client()``, which dispatches
+    in-process, so the shared server is never started. ``live_server`` tests
+    get their own server with a bound HTTP listener instead.
+    """
+    if request.node.get_closest_marker("live_server") is None:
+        _session_server.reset()
+        yield _session_server
+        return
+
+    server = BreakpointServer(BreakpointManager(), port=0, port_file=tmp_path / "port")
+    thread = threading.Thread(target=server.start, daemon=True)
+    thread.start()
+    assert server.wait_until_ready(timeout=2.0), "server did not start"
     yield server
     server.stop()
 
 
+@pytest.fixture
+def go_server(server):
+    """Provide the server with an ``add`` breakpoint and the global behavior set to go."""
+    server.manager.add_breakpoint("add")
+    server.manager.set_default_behavior("go")
+    return server
+
+
+@pytest.fixture(scope="module")
+def serializer() -> Serializer:
+    """Share one Serializer across the module."""
+    return Serializer()
+
+
+@pytest.fixture(scope="module")
+def common_payloads(serializer: Serializer) -> dict[str, SerializedObject]:
+    """Serialize the payloads several tests send, once per module."""
+    return {
+        "alpha": serializer.force_serialize_with_data(["alpha"]),
+        "target": serializer.force_serialize_with_data({"target": True}),
+        "three": serializer.force_serialize_with_data(3),
+    }
+
+
 def test_can_create_server() -> None:
     """Test that server can be instantiated."""
     manager = BreakpointManager()
@@ -43,200 +216,200 @@ def test_server_can_start_and_stop() -> None:
     # Start in background thread
     thread = threading.Thread(target=server.start, daemon=True)
     thread.start()
-    time.sleep(0.2)  # Give it time to start
+    assert server.wait_until_ready(timeout=2.0)
 
     assert server.is_running()
 
+    # stop() blocks until serve_forever() returns, so start() finishes promptly
     server.stop()
-    time.sleep(0.2)
+    thread.join(timeout=2.0)
 
+    assert not thread.is_alive()
     assert not server.is_running()
 
 
-def test_get_breakpoints_endpoint(server) -> None:
-    """Test GET /api/breakpoints endpoint."""
-    # Start server
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    # Add some breakpoints
-    server.manager.add_breakpoint("func1")
-    server.manager.add_breakpoint("func2")
-
-    # Test endpoint
-    response = server.test_client().get("/api/breakpoints")
+def test_reset_clears_manager_cids_repl_evals_and_call_sequence(server, client) -> None:
+    """Test that reset() drops all per-request state the server accumulates."""
+    data = b"payload"
+    cid = hashlib.sha512(data).hexdigest()
+    server.cid_store.store(cid, data)
+    server.manager.add_breakpoint("add")
+    pause_id = server.manager.add_paused_execution({"method_name": "add"})
+    eval_id = server.queue_repl_eval(pause_id, "session-1", "1 + 1")
+    response = client.post("/api/call/start", json=_call_start_payload())
     assert response.status_code == 200
-    data = json.loads(response.data)
-    assert "func1" in data["breakpoints"]
-    assert "func2" in data["breakpoints"]
-    assert data["breakpoint_behaviors"]["func1"] == "yield"
-    assert data["breakpoint_behaviors"]["func2"] == "yield"
-
-
-def test_add_breakpoint_endpoint(server) -> None:
-    """Test POST /api/breakpoints endpoint."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
 
-    response = server.test_client().post(
-        "/api/breakpoints",
-        data=json.dumps({"function_name": "my_func"}),
-        content_type="application/json"
-    )
+    server.reset()
 
-    assert response.status_code == 200
-    assert "my_func" in server.manager.get_breakpoints()
+    assert server.cid_store.get(cid) is None
+    assert server.manager.get_breakpoints() == []
+    assert server.pop_repl_eval(pause_id) is None
+    assert server.wait_for_repl_eval(eval_id, timeout_s=0.0) == ("missing", None)
+    call_id = client.post("/api/call/start", json=_call_start_payload()).get_json()["call_id"]
+    assert call_id.endswith("-001")
 
 
-def test_delete_breakpoint_endpoint(server) -> None:
-    """Test DELETE /api/breakpoints/<name> endpoint."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
+def test_breakpoints_endpoint_add_list_delete(server, client) -> None:
+    """Test POST, GET, and DELETE on /api/breakpoints in one flow."""
+    for function_name in ("func1", "func2"):
+        response = client.post("/api/breakpoints", json={"function_name": function_name})
+        assert response.status_code == 200
+    assert {"func1", "func2"} <= set(server.manager.get_breakpoints())
 
-    # Add a breakpoint first
-    server.manager.add_breakpoint("my_func")
+    response = client.get("/api/breakpoints")
+    assert response.status_code == 200
+    data = response.get_json()
+    assert {"func1", "func2"} <= set(data["breakpoints"])
+    assert data["breakpoint_behaviors"]["func1"] == "yield"
+    assert data["breakpoint_behaviors"]["func2"] == "yield"
 
-    # Delete it
-    response = server.test_client().delete("/api/breakpoints/my_func")
+    response = client.delete("/api/breakpoints/func1")
     assert response.status_code == 200
-    assert "my_func" not in server.manager.get_breakpoints()
+    assert "func1" not in server.manager.get_breakpoints()
+    assert "func2" in server.manager.get_breakpoints()
+
+
+def _post_and_fetch_placeholder(
+    server: BreakpointServer,
+    client,
+    serializer: Serializer,
+    placeholder: UnpicklablePlaceholder,
+    via: str,
+) -> dict[str, object]:
+    """Send a placeholder through the server and return the metadata it reports back."""
+    serialized = serializer.force_serialize_with_data(placeholder)
+    if via == "register":
+        response = client.post(
+            "/api/functions",
+            json={
+                "function_name": placeholder.object_name,
+                "function_cid": serialized.cid,
+                "function_data": serialized.data_base64,
+            },
+        )
+        assert response.status_code == 200
 
+        response = client.get("/api/functions")
+        assert response.status_code == 200
+        return response.get_json()["function_metadata"][placeholder.object_name]
 
-def test_register_function_includes_placeholder_metadata(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    placeholder = UnpicklablePlaceholder(
-        type_name="ConfiguredFunction",
-        module="nat.builder.workflow_builder",
-        qualname="ConfiguredFunction",
-        object_id="0x1",
-        repr_text="<ConfiguredFunction>",
-        str_text=None,
-        attributes={},
-        failed_attributes={},
-        pickle_error="TypeError: not picklable",
-        pickle_attempts=["dill.dumps: TypeError"],
-        capture_timestamp=0.0,
-        depth=0,
-        object_name="asset_tool",
-        object_path="nat.builder.workflow_builder.ConfiguredFunction",
+    process_pid = 1337
+    process_start_time = 555.0
+    response = client.post(
+        "/api/call/start",
+        json=_call_start_payload(
+            target={
+                "cid": serialized.cid,
+                "data": serialized.data_base64,
+                "client_ref": 777,
+            },
+            process_pid=process_pid,
+            process_start_time=process_start_time,
+        ),
     )
-    serializer = Serializer()
-    serialized = serializer.force_serialize_with_data(placeholder)
+    assert response.status_code == 200
 
-    response = server.test_client().post(
-        "/api/functions",
-        data=json.dumps({
-            "function_name": "asset_tool",
-            "function_cid": serialized.cid,
-            "function_data": serialized.data_base64,
-        }),
-        content_type="application/json",
+    history = server.manager.get_object_history(
+        make_process_key(process_pid, process_start_time), 777
     )
+    assert len(history) == 1
+    return history[0]["pretty"]
+
+
+@pytest.mark.parametrize(
+    ("placeholder", "via", "expected"),
+    [
+        pytest.param(
+            _CONFIGURED_FUNCTION_PLACEHOLDER,
+            "register",
+            {("__cideldill_placeholder__",): True, ("object_name",): "asset_tool"},
+            id="register-metadata",
+        ),
+        pytest.param(
+            _NESTED_PLACEHOLDER,
+            "register",
+            {
+                ("attributes", "payload", "ok"): {"nested": [1, 2]},
+                ("attributes", "payload", "bad", "__cideldill_placeholder__"): True,
+                ("attributes", "payload", "bad", "pickle_error"): "TypeError: no state",
+            },
+            id="register-nested-parts",
+        ),
+        pytest.param(
+            replace(_CONFIGURED_FUNCTION_PLACEHOLDER, object_id="0x2"),
+            "call_start",
+            {("__cideldill_placeholder__",): True},
+            id="call-start-client-ref",
+        ),
+    ],
+)
+def test_placeholder_metadata_roundtrips(
+    server, client, serializer, placeholder, via, expected
+) -> None:
+    """Test that UnpicklablePlaceholder metadata survives the round trip through the server."""
+    metadata = _post_and_fetch_placeholder(server, client, serializer, placeholder, via)
+
+    for path, value in expected.items():
+        node = metadata
+        for key in path:
+            node = node[key]
+        assert node == value, path
+
+
+def test_get_paused_executions_endpoint(server, client) -> None:
+    """Test GET /api/paused endpoint."""
+    call_data = {"function_name": "add", "args": {"a": 1, "b": 2}}
+    server.manager.add_paused_execution(call_data)
 
+    response = client.get("/api/paused")
     assert response.status_code == 200
-
-    response = server.test_client().get("/api/functions")
-    assert response.status_code == 200
-    data = json.loads(response.data)
-    metadata = data["function_metadata"]["asset_tool"]
-    assert metadata["__cideldill_placeholder__"] is True
-    assert metadata["object_name"] == "asset_tool"
+    data = response.get_json()
+    assert len(data["paused"]) == 1
+    assert data["paused"][0]["call_data"]["function_name"] == "add"
 
 
-def test_register_function_preserves_nested_serializable_metadata_parts(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    child = UnpicklablePlaceholder(
-        type_name="ExplodingState",
-        module="tests.unit.test_breakpoint_server",
-        qualname="ExplodingState",
-        object_id="0xchild",
-        repr_text="<ExplodingState>",
-        str_text=None,
-        attributes={},
-        failed_attributes={},
-        pickle_error="TypeError: no state",
-        pickle_attempts=["dill.dumps: TypeError"],
-        capture_timestamp=0.0,
-        depth=1,
-        object_name="bad",
-        object_path="tests.unit.test_breakpoint_server.ExplodingState",
-    )
-    parent = UnpicklablePlaceholder(
-        type_name="Container",
-        module="tests.unit.test_breakpoint_server",
-        qualname="Container",
-        object_id="0xparent",
-        repr_text="<Container>",
-        str_text=None,
-        attributes={
-            "payload": {
-                "ok": {"nested": [1, 2]},
-                "bad": child,
-            }
-        },
-        failed_attributes={},
-        pickle_error="TypeError: parent",
-        pickle_attempts=["dill.dumps: TypeError"],
-        capture_timestamp=0.0,
-        depth=0,
-        object_name="container_tool",
-        object_path="tests.unit.test_breakpoint_server.Container",
-    )
-    serializer = Serializer()
-    serialized = serializer.force_serialize_with_data(parent)
+def test_non_finite_floats_read_back_as_null(server, client) -> None:
+    """Test that NaN and Infinity sent by a Python client come back from /api/paused as null."""
+    server.manager.add_breakpoint("noop")
+    server.manager.set_default_behavior("stop")
+    call_site = {"timestamp": 0.0, "elapsed": float("nan"), "limit": float("inf")}
 
-    response = server.test_client().post(
-        "/api/functions",
-        data=json.dumps({
-            "function_name": "container_tool",
-            "function_cid": serialized.cid,
-            "function_data": serialized.data_base64,
-        }),
+    # Encoded with the stdlib, as requests does, so the body carries NaN/Infinity literals
+    response = client.post(
+        "/api/call/start",
+        data=json.dumps(_call_start_payload(call_site=call_site)),
         content_type="application/json",
     )
-    assert response.status_code == 200
+    assert response.get_json()["action"] == "poll"
 
-    response = server.test_client().get("/api/functions")
-    assert response.status_code == 200
-    metadata = json.loads(response.data)["function_metadata"]["container_tool"]
-    payload = metadata["attributes"]["payload"]
-    assert payload["ok"] == {"nested": [1, 2]}
-    assert payload["bad"]["__cideldill_placeholder__"] is True
-    assert "TypeError" in payload["bad"]["pickle_error"]
+    response = client.get("/api/paused")
+    assert b"NaN" not in response.data
+    assert b"Infinity" not in response.data
+    paused_call_site = response.get_json()["paused"][0]["call_data"]["call_site"]
+    assert paused_call_site == {"timestamp": 0.0, "elapsed": None, "limit": None}
 
 
-def test_get_paused_executions_endpoint(server) -> None:
-    """Test GET /api/paused endpoint."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
+def test_get_paused_long_poll_returns_new_pause(server, client) -> None:
+    """Test GET /api/paused?wait=...&since=... blocks until a new pause arrives."""
+    response = client.get("/api/paused")
+    since = int(response.headers["X-Last-Id"])
 
-    # Add a paused execution
-    call_data = {"function_name": "add", "args": {"a": 1, "b": 2}}
-    pause_id = server.manager.add_paused_execution(call_data)
+    timer = threading.Timer(
+        0.05, server.manager.add_paused_execution, args=({"function_name": "add"},)
+    )
+    timer.start()
+    try:
+        response = client.get(f"/api/paused?wait=5&since={since}")
+    finally:
+        timer.join()
 
-    response = server.test_client().get("/api/paused")
     assert response.status_code == 200
-    data = json.loads(response.data)
-    assert len(data["paused"]) == 1
+    assert int(response.headers["X-Last-Id"]) == since + 1
+    data = response.get_json()
     assert data["paused"][0]["call_data"]["function_name"] == "add"
 
 
-def test_call_start_tracks_client_ref_state(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    serializer = Serializer()
+def test_call_start_tracks_client_ref_state(server, client, serializer) -> None:
     mutable = ["alpha"]
 
     def make_item(obj, client_ref):
@@ -249,40 +422,33 @@ def test_call_start_tracks_client_ref_state(server) -> None:
 
     process_pid = 4242
     process_start_time = 123.456
-    process_key = f"{process_start_time:.6f}+{process_pid}"
-
-    payload1 = {
-        "method_name": "noop",
-        "target_cid": "t1",
-        "target": make_item({"target": True}, client_ref=1),
-        "args": [make_item(mutable, client_ref=99)],
-        "kwargs": {},
-        "call_site": {"timestamp": 0.0},
-        "process_pid": process_pid,
-        "process_start_time": process_start_time,
-    }
-    response1 = server.test_client().post(
+    process_key = make_process_key(process_pid, process_start_time)
+
+    payload1 = _call_start_payload(
+        target_cid="t1",
+        target=make_item({"target": True}, client_ref=1),
+        args=[make_item(mutable, client_ref=99)],
+        process_pid=process_pid,
+        process_start_time=process_start_time,
+    )
+    response1 = client.post(
         "/api/call/start",
-        data=json.dumps(payload1),
-        content_type="application/json",
+        json=payload1,
     )
     assert response1.status_code == 200
 
     mutable.append("beta")
-    payload2 = {
-        "method_name": "noop",
-        "target_cid": "t2",
-        "target": make_item({"target": True}, client_ref=1),
-        "args": [make_item(mutable, client_ref=99)],
-        "kwargs": {},
-        "call_site": {"timestamp": 1.0},
-        "process_pid": process_pid,
-        "process_start_time": process_start_time,
-    }
-    response2 = server.test_client().post(
+    payload2 = _call_start_payload(
+        target_cid="t2",
+        target=make_item({"target": True}, client_ref=1),
+        args=[make_item(mutable, client_ref=99)],
+        call_site={"timestamp": 1.0},
+        process_pid=process_pid,
+        process_start_time=process_start_time,
+    )
+    response2 = client.post(
         "/api/call/start",
-        data=json.dumps(payload2),
-        content_type="application/json",
+        json=payload2,
     )
     assert response2.status_code == 200
 
@@ -292,97 +458,27 @@ def test_call_start_tracks_client_ref_state(server) -> None:
     assert history[1]["pretty"] == "['alpha', 'beta']"
 
 
-def test_call_start_tracks_client_ref_for_placeholder(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    placeholder = UnpicklablePlaceholder(
-        type_name="ConfiguredFunction",
-        module="nat.builder.workflow_builder",
-        qualname="ConfiguredFunction",
-        object_id="0x2",
-        repr_text="<ConfiguredFunction>",
-        str_text=None,
-        attributes={},
-        failed_attributes={},
-        pickle_error="TypeError: not picklable",
-        pickle_attempts=["dill.dumps: TypeError"],
-        capture_timestamp=0.0,
-        depth=0,
-        object_name="asset_tool",
-        object_path="nat.builder.workflow_builder.ConfiguredFunction",
-    )
-    serializer = Serializer()
-    serialized = serializer.force_serialize_with_data(placeholder)
-
-    process_pid = 1337
-    process_start_time = 555.0
-    process_key = f"{process_start_time:.6f}+{process_pid}"
-
-    payload = {
-        "method_name": "noop",
-        "target_cid": "t1",
-        "target": {
-            "cid": serialized.cid,
-            "data": serialized.data_base64,
-            "client_ref": 777,
-        },
-        "args": [],
-        "kwargs": {},
-        "call_site": {"timestamp": 0.0},
-        "process_pid": process_pid,
-        "process_start_time": process_start_time,
-    }
-
-    response = server.test_client().post(
-        "/api/call/start",
-        data=json.dumps(payload),
-        content_type="application/json",
-    )
-    assert response.status_code == 200
-
-    history = server.manager.get_object_history(process_key, 777)
-    assert len(history) == 1
-    assert history[0]["pretty"]["__cideldill_placeholder__"] is True
-
-
-def test_continue_execution_endpoint(server) -> None:
+def test_continue_execution_endpoint(server, client) -> None:
     """Test POST /api/paused/<id>/continue endpoint."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    # Add a paused execution
     call_data = {"function_name": "add", "args": {"a": 1, "b": 2}}
     pause_id = server.manager.add_paused_execution(call_data)
 
-    # Continue it
-    response = server.test_client().post(
-        f"/api/paused/{pause_id}/continue",
-        data=json.dumps({"action": "continue"}),
-        content_type="application/json"
-    )
+    response = client.post(f"/api/paused/{pause_id}/continue", json={"action": "continue"})
 
     assert response.status_code == 200
     assert len(server.manager.get_paused_executions()) == 0
 
 
-def test_continue_execution_can_replace_function(server) -> None:
+def test_continue_execution_can_replace_function(server, client) -> None:
     """Test POST /api/paused/<id>/continue supports replacement function."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
     pause_id = server.manager.add_paused_execution({"method_name": "add"})
 
-    response = server.test_client().post(
+    response = client.post(
         f"/api/paused/{pause_id}/continue",
-        data=json.dumps({
+        json={
             "action": "continue",
             "replacement_function": "multiply",
-        }),
-        content_type="application/json",
+        },
     )
 
     assert response.status_code == 200
@@ -391,133 +487,127 @@ def test_continue_execution_can_replace_function(server) -> None:
     assert action["function_name"] == "multiply"
 
 
-def test_call_start_replaces_when_breakpoint_go_and_replacement_set(server) -> None:
-    """If breakpoint doesn't pause and has replacement, server should replace."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
+def test_continue_executions_endpoint_resumes_batch(server, client) -> None:
+    """Test POST /api/paused/continue resumes every listed pause."""
+    id1 = server.manager.add_paused_execution({"function_name": "add"})
+    id2 = server.manager.add_paused_execution({"function_name": "mul"})
+    id3 = server.manager.add_paused_execution({"function_name": "div"})
 
-    serializer = Serializer()
-    target_payload = serializer.force_serialize_with_data({"x": 1})
+    response = client.post(
+        "/api/paused/continue",
+        json={"ids": [id1, id3], "action": "continue"},
+    )
 
-    server.manager.add_breakpoint("add")
-    server.manager.set_default_behavior("go")
-    server.manager.set_breakpoint_replacement("add", "multiply")
+    assert response.status_code == 200
+    assert response.get_json()["pause_ids"] == [id1, id3]
+    assert [p["id"] for p in server.manager.get_paused_executions()] == [id2]
+    assert server.manager.get_resume_action(id1) == {"action": "continue"}
+    assert server.manager.get_resume_action(id3) == {"action": "continue"}
+
+
+def test_continue_executions_endpoint_rejects_missing_ids(client) -> None:
+    """Test POST /api/paused/continue requires a list of pause IDs."""
+    response = client.post(
+        "/api/paused/continue",
+        json={"action": "continue"},
+    )
 
-    response = server.test_client().post(
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "invalid_ids"
+
+
+def test_call_start_replaces_when_breakpoint_go_and_replacement_set(go_server, client) -> None:
+    """If breakpoint doesn't pause and has replacement, server should replace."""
+    go_server.manager.set_breakpoint_replacement("add", "multiply")
+
+    response = client.post(
         "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {"cid": target_payload.cid, "data": target_payload.data_base64},
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
+        json=_call_start_payload(
+            method_name="add",
+            target={"cid": _OPAQUE_TARGET.cid, "data": _OPAQUE_TARGET.data_base64},
+            call_site={"timestamp": 123.0},
+        ),
     )
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["action"] == "replace"
     assert data["function_name"] == "multiply"
 
 
-def test_call_complete_pauses_when_after_breakpoint_set(server) -> None:
+def test_call_complete_pauses_when_after_breakpoint_set(
+    go_server, client, common_payloads
+) -> None:
     """If after-breakpoint pauses, call completion should return poll action."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
+    result_payload = common_payloads["three"]
 
-    serializer = Serializer()
-    target_payload = serializer.force_serialize_with_data({"x": 1})
-    result_payload = serializer.force_serialize_with_data(3)
+    go_server.manager.set_after_breakpoint_behavior("add", "stop")
 
-    server.manager.add_breakpoint("add")
-    server.manager.set_default_behavior("go")
-    server.manager.set_after_breakpoint_behavior("add", "stop")
-
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {"cid": target_payload.cid, "data": target_payload.data_base64},
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
+        json=_call_start_payload(
+            method_name="add",
+            target={"cid": _OPAQUE_TARGET.cid, "data": _OPAQUE_TARGET.data_base64},
+            call_site={"timestamp": 123.0},
+        ),
     )
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     call_id = data["call_id"]
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/complete",
-        data=json.dumps({
+        json={
             "call_id": call_id,
             "status": "success",
             "result_cid": result_payload.cid,
             "result_data": result_payload.data_base64,
-        }),
-        content_type="application/json",
+        },
     )
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["action"] == "poll"
 
-    paused = server.manager.get_paused_executions()
+    paused = go_server.manager.get_paused_executions()
     assert len(paused) == 1
     assert paused[0]["call_data"]["method_name"] == "add"
     assert paused[0]["call_data"]["pretty_result"] == "3"
 
 
-def test_call_complete_pauses_on_exception_when_global_exception_behavior(server) -> None:
+def test_call_complete_pauses_on_exception_when_global_exception_behavior(
+    server, client, serializer
+) -> None:
     """Global exception mode should pause on exception completion."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
     server.manager.add_breakpoint("add")
     server.manager.set_default_behavior("exception")
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
+        json=_call_start_payload(
+            method_name="add",
+            call_site={"timestamp": 123.0},
+        ),
     )
     assert response.status_code == 200
-    start_data = json.loads(response.data)
+    start_data = response.get_json()
     assert start_data["action"] == "continue"
     call_id = start_data["call_id"]
 
-    serializer = Serializer()
     exception_payload = serializer.force_serialize_with_data({
         "type": "ValueError",
         "message": "boom",
     })
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/complete",
-        data=json.dumps({
+        json={
             "call_id": call_id,
             "status": "exception",
             "exception_cid": exception_payload.cid,
             "exception_data": exception_payload.data_base64,
-        }),
-        content_type="application/json",
+        },
     )
     assert response.status_code == 200
-    complete_data = json.loads(response.data)
+    complete_data = response.get_json()
     assert complete_data["action"] == "poll"
 
     paused = server.manager.get_paused_executions()
@@ -525,48 +615,41 @@ def test_call_complete_pauses_on_exception_when_global_exception_behavior(server
     assert paused[0]["call_data"]["pause_reason"] == "exception"
 
 
+@pytest.mark.live_server
 def test_get_port_number(server) -> None:
     """Test that we can get the port number."""
-    # When using port=0, Flask will assign a random port
-    # The get_port() will still return 0 until the server binds
-    # This is expected behavior
+    # When using port=0, the OS assigns a random port once the server binds
     port = server.get_port()
-    assert port == 0  # Initial port value from fixture
+    assert port == server.actual_port
+    assert port != 0
 
 
-def test_root_page_serves_html(server) -> None:
+def test_root_page_serves_html(client) -> None:
     """Test that the root page serves HTML UI."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    response = server.test_client().get("/")
+    response = client.get("/")
     assert response.status_code == 200
-    assert b"Interactive Breakpoints" in response.data
-    assert b"CID el Dill" in response.data
-    # Check for key UI elements
-    assert b"pausedExecutions" in response.data
-    assert b"breakpointsList" in response.data
-    assert b"selectedReplacements" in response.data
-    assert b"breakpoint-replacement-select" in response.data
-    assert b"isBreakpointSelectActive" in response.data
-    assert b"sortBreakpoints" in response.data
-    html = response.data.decode("utf-8")
-    assert "Stop at exceptions" in html
-    assert "Stop at breakpoints and exceptions" in html
-    assert "After: Defer to global default" in html
-    assert "🚦" in html
-
-
-def test_openapi_spec_endpoint(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
+    missing = set(_ROOT_PAGE_TOKENS) - set(_ROOT_PAGE_TOKENS_RE.findall(response.data))
+    assert not missing
+
 
-    response = server.test_client().get("/openapi.json")
+def test_root_page_is_rendered_once(client, monkeypatch) -> None:
+    """Test that repeat requests for / reuse the first rendering."""
+    first = client.get("/").data
+
+    def _fail_render(*_args, **_kwargs):
+        raise AssertionError("root page rendered again")
+
+    monkeypatch.setattr(
+        "cideldill_server.breakpoint_server.render_template_string", _fail_render
+    )
+    assert client.get("/").data == first
+
+
+def test_openapi_spec_endpoint(client) -> None:
+    response = client.get("/openapi.json")
     assert response.status_code == 200
     assert response.is_json
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["openapi"].startswith("3.")
     assert data["info"]["title"] == "CID el Dill Breakpoint Server API"
     assert "/api/breakpoints" in data["paths"]
@@ -575,74 +658,49 @@ def test_openapi_spec_endpoint(server) -> None:
     assert "/api/paused" in data["paths"]
 
 
-def test_openapi_docs_endpoint(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    response = server.test_client().get("/docs")
+def test_openapi_docs_endpoint(client) -> None:
+    response = client.get("/docs")
     assert response.status_code == 200
     assert response.mimetype == "text/html"
-    html = response.data.decode("utf-8")
-    assert "SwaggerUIBundle" in html
-    assert "/openapi.json" in html
-
-
-def test_behavior_endpoint_supports_exception_modes(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    response = server.test_client().post(
-        "/api/behavior",
-        data=json.dumps({"behavior": "exception"}),
-        content_type="application/json",
-    )
-    assert response.status_code == 200
-    assert json.loads(response.data)["behavior"] == "exception"
-
-    response = server.test_client().post(
-        "/api/behavior",
-        data=json.dumps({"behavior": "stop_exception"}),
-        content_type="application/json",
-    )
-    assert response.status_code == 200
-    assert json.loads(response.data)["behavior"] == "stop_exception"
-
-    response = server.test_client().get("/api/behavior")
-    assert response.status_code == 200
-    assert json.loads(response.data)["behavior"] == "stop_exception"
-
-
-def test_after_behavior_endpoint_supports_exception_modes_and_defer(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
+    html = response.data
+    assert b"SwaggerUIBundle" in html
+    assert b"/openapi.json" in html
+
+
+@pytest.mark.parametrize(
+    ("path", "behaviors", "current"),
+    [
+        pytest.param(
+            "/api/behavior",
+            ("exception", "stop_exception"),
+            lambda m: m.get_default_behavior(),
+            id="global",
+        ),
+        pytest.param(
+            "/api/breakpoints/add/after_behavior",
+            ("exception", "yield"),
+            lambda m: m.get_after_breakpoint_behavior("add"),
+            id="after_breakpoint",
+        ),
+    ],
+)
+def test_behavior_endpoints_support_exception_modes(
+    server, client,
+    path: str,
+    behaviors: tuple[str, ...],
+    current: Callable[[BreakpointManager], str],
+) -> None:
+    """Test that the behavior endpoints accept each exception-aware mode."""
     server.manager.add_breakpoint("add")
-    response = server.test_client().post(
-        "/api/breakpoints/add/after_behavior",
-        data=json.dumps({"behavior": "exception"}),
-        content_type="application/json",
-    )
-    assert response.status_code == 200
-    assert json.loads(response.data)["behavior"] == "exception"
-
-    response = server.test_client().post(
-        "/api/breakpoints/add/after_behavior",
-        data=json.dumps({"behavior": "yield"}),
-        content_type="application/json",
-    )
-    assert response.status_code == 200
-    assert json.loads(response.data)["behavior"] == "yield"
+    for behavior in behaviors:
+        response = client.post(path, json={"behavior": behavior})
+        assert response.status_code == 200
+        assert response.get_json()["behavior"] == behavior
+        assert current(server.manager) == behavior
 
 
-def test_report_com_error_endpoint(server) -> None:
+def test_report_com_error_endpoint(server, client) -> None:
     """Test POST /api/report-com-error and /api/com-errors."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
     payload = {
         "summary": "timeout",
         "method": "POST",
@@ -652,10 +710,9 @@ def test_report_com_error_endpoint(server) -> None:
         "exception_message": "request timed out",
     }
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/report-com-error",
-        data=json.dumps(payload),
-        content_type="application/json",
+        json=payload,
     )
     assert response.status_code == 200
 
@@ -663,65 +720,52 @@ def test_report_com_error_endpoint(server) -> None:
     assert errors
     assert errors[-1]["summary"] == "timeout"
 
-    response = server.test_client().get("/api/com-errors")
+    response = client.get("/api/com-errors")
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["errors"][0]["summary"] == "timeout"
 
-    response = server.test_client().get("/com-errors")
+    response = client.get("/com-errors")
     assert response.status_code == 200
     assert b"Communication Errors" in response.data
 
 
-def test_objects_page_lists_refs_and_cids(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    serializer = Serializer()
-    target_payload = serializer.force_serialize_with_data({"target": True})
-    arg_payload = serializer.force_serialize_with_data(["alpha"])
+def test_objects_page_lists_refs_and_cids(client, common_payloads) -> None:
+    target_payload = common_payloads["target"]
+    arg_payload = common_payloads["alpha"]
 
     process_pid = 8080
     process_start_time = 111.222
-    process_key = f"{process_start_time:.6f}+{process_pid}"
+    process_key = make_process_key(process_pid, process_start_time)
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/start",
-        data=json.dumps({
-            "method_name": "noop",
-            "target_cid": "t1",
-            "target": {
+        json=_call_start_payload(
+            target_cid="t1",
+            target={
                 "cid": target_payload.cid,
                 "data": target_payload.data_base64,
                 "client_ref": 1,
             },
-            "args": [{
+            args=[{
                 "cid": arg_payload.cid,
                 "data": arg_payload.data_base64,
                 "client_ref": 99,
             }],
-            "kwargs": {},
-            "call_site": {"timestamp": 0.0},
-            "process_pid": process_pid,
-            "process_start_time": process_start_time,
-        }),
-        content_type="application/json",
+            process_pid=process_pid,
+            process_start_time=process_start_time,
+        ),
     )
     assert response.status_code == 200
 
-    response = server.test_client().get("/objects")
+    response = client.get("/objects")
     assert response.status_code == 200
-    body = response.data.decode()
-    assert arg_payload.cid in body
-    assert f"ref:{process_key}:99" in body
+    body = response.data
+    assert arg_payload.cid.encode() in body
+    assert f"ref:{process_key}:99".encode() in body
 
 
-def test_objects_page_visually_marks_exception_rows(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
+def test_objects_page_visually_marks_exception_rows(server, client) -> None:
     process_key = "111.000000+7"
     server.manager.record_object_snapshot(
         process_key,
@@ -736,77 +780,58 @@ def test_objects_page_visually_marks_exception_rows(server) -> None:
         },
     )
 
-    response = server.test_client().get("/objects")
+    response = client.get("/objects")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert "pill-exception" in html
+    html = response.data
+    assert b"pill-exception" in html
 
 
-def test_objects_page_filter_supports_multi_term_search(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    response = server.test_client().get("/objects")
+def test_objects_page_filter_supports_multi_term_search(client) -> None:
+    response = client.get("/objects")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert "split(/\\s+/)" in html
-    assert "tokens.every((token) => haystack.includes(token))" in html
+    html = response.data
+    assert b"split(/\\s+/)" in html
+    assert b"tokens.every((token) => haystack.includes(token))" in html
 
 
-def test_object_pages_show_backrefs_and_snapshots(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    serializer = Serializer()
-    arg_payload = serializer.force_serialize_with_data(["alpha"])
+def test_object_pages_show_backrefs_and_snapshots(client, common_payloads) -> None:
+    arg_payload = common_payloads["alpha"]
 
     process_pid = 9090
     process_start_time = 222.333
-    process_key = f"{process_start_time:.6f}+{process_pid}"
+    process_key = make_process_key(process_pid, process_start_time)
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/start",
-        data=json.dumps({
-            "method_name": "noop",
-            "target_cid": "t1",
-            "target": {
+        json=_call_start_payload(
+            target_cid="t1",
+            target={
                 "cid": arg_payload.cid,
                 "data": arg_payload.data_base64,
                 "client_ref": 7,
             },
-            "args": [{
+            args=[{
                 "cid": arg_payload.cid,
                 "data": arg_payload.data_base64,
                 "client_ref": 7,
             }],
-            "kwargs": {},
-            "call_site": {"timestamp": 0.0},
-            "process_pid": process_pid,
-            "process_start_time": process_start_time,
-        }),
-        content_type="application/json",
+            process_pid=process_pid,
+            process_start_time=process_start_time,
+        ),
     )
     assert response.status_code == 200
 
     ref = f"ref:{process_key}:7"
-    response = server.test_client().get(f"/object/{ref}")
+    response = client.get(f"/object/{ref}")
     assert response.status_code == 200
-    body = response.data.decode()
-    assert arg_payload.cid in body
+    assert arg_payload.cid.encode() in response.data
 
-    response = server.test_client().get(f"/object/{arg_payload.cid}")
+    response = client.get(f"/object/{arg_payload.cid}")
     assert response.status_code == 200
-    body = response.data.decode()
-    assert ref in body
+    assert ref.encode() in response.data
 
 
-def test_object_ref_page_visually_marks_exception_rows(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
+def test_object_ref_page_visually_marks_exception_rows(server, client) -> None:
     process_key = "222.000000+8"
     client_ref = 8
     server.manager.record_object_snapshot(
@@ -822,55 +847,45 @@ def test_object_ref_page_visually_marks_exception_rows(server) -> None:
         },
     )
 
-    response = server.test_client().get(f"/object/ref:{process_key}:{client_ref}")
+    response = client.get(f"/object/ref:{process_key}:{client_ref}")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert "role-pill exception" in html
+    html = response.data
+    assert b"role-pill exception" in html
 
 
-def test_register_function_tracks_client_ref(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    response = server.test_client().post(
+def test_register_function_tracks_client_ref(client) -> None:
+    response = client.post(
         "/api/functions",
-        data=json.dumps({
+        json={
             "function_name": "asset_tool",
             "function_client_ref": 42,
-        }),
-        content_type="application/json",
+        },
     )
     assert response.status_code == 200
 
-    response = server.test_client().get("/api/functions")
+    response = client.get("/api/functions")
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["function_metadata"]["asset_tool"]["client_ref"] == 42
 
 
-def test_call_tree_links_registered_target_ref(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    response = server.test_client().post(
+def test_call_tree_links_registered_target_ref(client) -> None:
+    response = client.post(
         "/api/functions",
-        data=json.dumps({
+        json={
             "function_name": "demo_func",
             "function_client_ref": 17,
-        }),
-        content_type="application/json",
+        },
     )
     assert response.status_code == 200
 
     process_pid = 5555
     process_start_time = 333.444
-    process_key = f"{process_start_time:.6f}+{process_pid}"
+    process_key = make_process_key(process_pid, process_start_time)
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/event",
-        data=json.dumps({
+        json={
             "method_name": "with_debug.register",
             "status": "registered",
             "call_site": {"timestamp": 0.0},
@@ -880,439 +895,316 @@ def test_call_tree_links_registered_target_ref(server) -> None:
                 "event": "with_debug_registration",
                 "function_name": "demo_func",
             },
-        }),
-        content_type="application/json",
+        },
     )
     assert response.status_code == 200
 
-    response = server.test_client().get(f"/call-tree/{process_key}")
+    response = client.get(f"/call-tree/{process_key}")
     assert response.status_code == 200
-    body = response.data.decode()
-    assert "registered_target_ref" in body
-    assert f"ref:{process_key}:17" in body
-
+    body = response.data
+    assert b"registered_target_ref" in body
+    assert f"ref:{process_key}:17".encode() in body
 
-def test_call_tree_visually_marks_exception_nodes(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
 
+def test_call_tree_visually_marks_exception_nodes(server, client) -> None:
     process_key = "333.000000+9"
-    server.manager.record_call({
-        "call_id": "call-ex-tree",
-        "method_name": "explode",
-        "status": "exception",
-        "pretty_args": [],
-        "pretty_kwargs": {},
-        "signature": None,
-        "exception": {"type": "ValueError", "message": "boom"},
-        "call_site": {"timestamp": 3.0, "stack_trace": []},
-        "process_pid": 9,
-        "process_start_time": 333.0,
-        "process_key": process_key,
-        "started_at": 3.0,
-        "completed_at": 3.0,
-    })
-
-    response = server.test_client().get(f"/call-tree/{process_key}")
+    server.manager.record_call(_call_record(
+        call_id="call-ex-tree",
+        method_name="explode",
+        status="exception",
+        exception={"type": "ValueError", "message": "boom"},
+        call_site={"timestamp": 3.0, "stack_trace": []},
+        process_pid=9,
+        process_start_time=333.0,
+        process_key=process_key,
+        started_at=3.0,
+        completed_at=3.0,
+    ))
+
+    response = client.get(f"/call-tree/{process_key}")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert "exception-badge" in html
-    assert "⚠️ EXCEPTION" in html
+    html = response.data
+    assert b"exception-badge" in html
+    assert "⚠️ EXCEPTION".encode() in html
 
 
-def test_breakpoint_history_links_registration_call_tree(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
+def test_breakpoint_history_links_registration_call_tree(server, client) -> None:
     process_key = "process-1"
 
-    server.manager.record_call({
-        "call_id": "call-late",
-        "method_name": "with_debug.register",
-        "status": "registered",
-        "pretty_result": {"function_name": "demo_func"},
-        "process_pid": 123,
-        "process_start_time": 10.0,
-        "process_key": process_key,
-        "started_at": 10.0,
-        "completed_at": 10.0,
-    })
-    server.manager.record_call({
-        "call_id": "call-early",
-        "method_name": "with_debug.register",
-        "status": "registered",
-        "pretty_result": {"function_name": "demo_func"},
-        "process_pid": 123,
-        "process_start_time": 10.0,
-        "process_key": process_key,
-        "started_at": 5.0,
-        "completed_at": 5.0,
-    })
+    server.manager.record_calls([
+        {
+            "call_id": call_id,
+            "method_name": "with_debug.register",
+            "status": "registered",
+            "pretty_result": {"function_name": "demo_func"},
+            "process_pid": 123,
+            "process_start_time": 10.0,
+            "process_key": process_key,
+            "started_at": at,
+            "completed_at": at,
+        }
+        for call_id, at in (("call-late", 10.0), ("call-early", 5.0))
+    ])
 
-    response = server.test_client().get("/breakpoint/demo_func/history")
+    response = client.get("/breakpoint/demo_func/history")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert f"/call-tree/{process_key}?selected=call-early" in html
+    html = response.data
+    assert f"/call-tree/{process_key}?selected=call-early".encode() in html
 
 
-def test_object_ref_links_first_seen_call_tree(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
+def test_object_ref_links_first_seen_call_tree(server, client) -> None:
     process_key = "process-2"
     client_ref = 99
-    server.manager.record_object_snapshot(
+    server.manager.record_object_snapshots(
         process_key,
-        client_ref,
-        {
-            "timestamp": 9.0,
-            "call_id": "call-late",
-            "method_name": "noop",
-            "role": "arg",
-            "cid": "deadbeef" * 8,
-            "pretty": "later",
-        },
-    )
-    server.manager.record_object_snapshot(
-        process_key,
-        client_ref,
-        {
-            "timestamp": 2.0,
-            "call_id": "call-early",
-            "method_name": "noop",
-            "role": "arg",
-            "cid": "feedface" * 8,
-            "pretty": "earlier",
-        },
+        [
+            (client_ref, {
+                "timestamp": 9.0,
+                "call_id": "call-late",
+                "method_name": "noop",
+                "role": "arg",
+                "cid": "deadbeef" * 8,
+                "pretty": "later",
+            }),
+            (client_ref, {
+                "timestamp": 2.0,
+                "call_id": "call-early",
+                "method_name": "noop",
+                "role": "arg",
+                "cid": "feedface" * 8,
+                "pretty": "earlier",
+            }),
+        ],
     )
 
-    response = server.test_client().get(f"/object/ref:{process_key}:{client_ref}")
+    response = client.get(f"/object/ref:{process_key}:{client_ref}")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert f"/call-tree/{process_key}?selected=call-early" in html
+    html = response.data
+    assert f"/call-tree/{process_key}?selected=call-early".encode() in html
 
 
-def test_call_tree_index_supports_incremental_text_filtering(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    server.manager.record_call({
-        "call_id": "call-index-1",
-        "method_name": "noop",
-        "status": "success",
-        "pretty_args": [],
-        "pretty_kwargs": {},
-        "signature": None,
-        "process_pid": 123,
-        "process_start_time": 1000.0,
-        "process_key": "1000.000000+123",
-        "started_at": 1.0,
-        "completed_at": 1.1,
-    })
+def test_call_tree_index_supports_incremental_text_filtering(server, client) -> None:
+    server.manager.record_call(_call_record(
+        call_id="call-index-1",
+        process_pid=123,
+        process_start_time=1000.0,
+        process_key="1000.000000+123",
+        completed_at=1.1,
+    ))
 
-    response = server.test_client().get("/call-tree")
+    response = client.get("/call-tree")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert 'id="searchInput"' in html
-    assert "search.addEventListener('input'" in html
-    assert "tokens.every((token) => row.searchText.includes(token))" in html
-
+    html = response.data
+    assert b'id="searchInput"' in html
+    assert b"search.addEventListener('input'" in html
+    assert b"tokens.every((token) => row.searchText.includes(token))" in html
 
-def test_call_tree_index_search_matches_call_item_text(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
 
+def test_call_tree_index_search_matches_call_item_text(server, client) -> None:
     process_key = "1000.000000+555"
-    server.manager.record_call({
-        "call_id": "call-search-1",
-        "method_name": "needle_method",
-        "status": "success",
-        "pretty_args": ["arg-needle"],
-        "pretty_kwargs": {"k": "needle-kw"},
-        "pretty_result": "needle-result",
-        "signature": None,
-        "call_site": {"timestamp": 2.0, "stack_trace": []},
-        "process_pid": 555,
-        "process_start_time": 1000.0,
-        "process_key": process_key,
-        "started_at": 2.0,
-        "completed_at": 2.1,
-    })
-
-    response = server.test_client().get("/call-tree")
+    server.manager.record_call(_call_record(
+        call_id="call-search-1",
+        method_name="needle_method",
+        pretty_args=["arg-needle"],
+        pretty_kwargs={"k": "needle-kw"},
+        pretty_result="needle-result",
+        call_site={"timestamp": 2.0, "stack_trace": []},
+        process_pid=555,
+        process_start_time=1000.0,
+        process_key=process_key,
+        started_at=2.0,
+        completed_at=2.1,
+    ))
+
+    response = client.get("/call-tree")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
+    html = response.data
 
-    match = re.search(r"const rows = (\[.*?\]);", html, re.S)
-    assert match, "Expected call tree rows data to be embedded in HTML."
-    rows = json.loads(match.group(1))
+    rows = _embedded_json(html, b"const rows = [")
     row = next(item for item in rows if item["process_key"] == process_key)
     assert "needle_method" in row["searchText"]
     assert "needle-kw" in row["searchText"]
 
 
-def test_call_tree_index_links_preserve_filter_query(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
+def test_call_tree_index_links_preserve_filter_query(server, client) -> None:
+    server.manager.record_call(_call_record(
+        call_id="call-link-1",
+        process_pid=999,
+        process_start_time=2000.0,
+        process_key="2000.000000+999",
+        completed_at=1.1,
+    ))
 
-    server.manager.record_call({
-        "call_id": "call-link-1",
-        "method_name": "noop",
-        "status": "success",
-        "pretty_args": [],
-        "pretty_kwargs": {},
-        "signature": None,
-        "call_site": {"timestamp": 1.0, "stack_trace": []},
-        "process_pid": 999,
-        "process_start_time": 2000.0,
-        "process_key": "2000.000000+999",
-        "started_at": 1.0,
-        "completed_at": 1.1,
-    })
-
-    response = server.test_client().get("/call-tree")
+    response = client.get("/call-tree")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert "params.set('filter', state.filterText)" in html
+    html = response.data
+    assert b"params.set('filter', state.filterText)" in html
 
 
-def test_call_tree_detail_supports_incremental_filter_from_query(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
+def test_call_tree_detail_supports_incremental_filter_from_query(server, client) -> None:
     process_key = "3000.000000+321"
-    server.manager.record_call({
-        "call_id": "call-detail-1",
-        "method_name": "needle_detail",
-        "status": "success",
-        "pretty_args": ["alpha"],
-        "pretty_kwargs": {"beta": "needle"},
-        "signature": None,
-        "call_site": {"timestamp": 3.0, "stack_trace": []},
-        "process_pid": 321,
-        "process_start_time": 3000.0,
-        "process_key": process_key,
-        "started_at": 3.0,
-        "completed_at": 3.2,
-    })
-
-    response = server.test_client().get(f"/call-tree/{process_key}?filter=needle")
+    server.manager.record_call(_call_record(
+        call_id="call-detail-1",
+        method_name="needle_detail",
+        pretty_args=["alpha"],
+        pretty_kwargs={"beta": "needle"},
+        call_site={"timestamp": 3.0, "stack_trace": []},
+        process_pid=321,
+        process_start_time=3000.0,
+        process_key=process_key,
+        started_at=3.0,
+        completed_at=3.2,
+    ))
+
+    response = client.get(f"/call-tree/{process_key}?filter=needle")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert 'id="searchInput"' in html
-    assert "const initialFilter = String(params.get('filter') || '').trim().toLowerCase();" in html
-    assert "tokens.every((token) => node.searchText.includes(token))" in html
-
-    match = re.search(r"const data = ({.*?});", html, re.S)
-    assert match, "Expected call tree data to be embedded in HTML."
-    payload = json.loads(match.group(1))
+    html = response.data
+    assert b'id="searchInput"' in html
+    assert b"const initialFilter = String(params.get('filter') || '').trim().toLowerCase();" in html
+    assert b"tokens.every((token) => node.searchText.includes(token))" in html
+
+    payload = _embedded_json(html, b"const data = {")
     assert "searchText" in payload["nodes"][0]
     assert "needle_detail" in payload["nodes"][0]["searchText"]
 
 
-def test_call_tree_detail_search_text_includes_exception_module_from_serialized_payload(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
+def test_call_tree_detail_search_text_includes_exception_module_from_serialized_payload(
+    client, serializer
+) -> None:
     process_pid = 4321
     process_start_time = 4444.0
-    process_key = f"{process_start_time:.6f}+{process_pid}"
+    process_key = make_process_key(process_pid, process_start_time)
 
-    start_response = server.test_client().post(
+    start_response = client.post(
         "/api/call/start",
-        data=json.dumps({
-            "method_name": "db_call",
-            "target_cid": "target-cid",
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 5.0, "stack_trace": []},
-            "process_pid": process_pid,
-            "process_start_time": process_start_time,
-        }),
-        content_type="application/json",
+        json=_call_start_payload(
+            method_name="db_call",
+            target_cid="target-cid",
+            call_site={"timestamp": 5.0, "stack_trace": []},
+            process_pid=process_pid,
+            process_start_time=process_start_time,
+        ),
     )
     assert start_response.status_code == 200
-    call_id = json.loads(start_response.data)["call_id"]
+    call_id = start_response.get_json()["call_id"]
 
     class OperationalError(Exception):
         __module__ = "psycopg2"
 
-    serializer = Serializer()
     exception_payload = serializer.force_serialize_with_data(
         OperationalError("database role does not exist")
     )
-    complete_response = server.test_client().post(
+    complete_response = client.post(
         "/api/call/complete",
-        data=json.dumps({
+        json={
             "call_id": call_id,
             "status": "exception",
             "exception_cid": exception_payload.cid,
             "exception_data": exception_payload.data_base64,
-        }),
-        content_type="application/json",
+        },
     )
     assert complete_response.status_code == 200
 
-    response = server.test_client().get(f"/call-tree/{process_key}")
+    response = client.get(f"/call-tree/{process_key}")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    match = re.search(r"const data = ({.*?});", html, re.S)
-    assert match, "Expected call tree data to be embedded in HTML."
-    payload = json.loads(match.group(1))
+    html = response.data
+    payload = _embedded_json(html, b"const data = {")
     assert "psycopg2" in payload["nodes"][0]["searchText"]
 
 
-def test_frame_endpoint_renders_source_for_paused_execution(server) -> None:
-    """Test GET /frame/<pause_id>/<frame_index> endpoint."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
+# A stack frame pointing at this file, so the frame page has real source to render
+_SOURCE_FRAME: Mapping[str, object] = MappingProxyType({
+    "filename": __file__,
+    "lineno": 1,
+    "function": "test_frame_endpoint_renders_source",
+    "code_context": "def test_frame_endpoint_renders_source(server, client, record_frame) -> None:",
+})
+
 
+def _frame_url_for_paused_execution(server: BreakpointServer) -> str:
     pause_id = server.manager.add_paused_execution({
         "method_name": "noop",
-        "call_site": {
-            "stack_trace": [
-                {
-                    "filename": __file__,
-                    "lineno": 1,
-                    "function": "test_frame_endpoint_renders_source_for_paused_execution",
-                    "code_context": "def test_frame_endpoint_renders_source_for_paused_execution(server) -> None:",
-                }
-            ]
-        },
+        "call_site": {"stack_trace": [dict(_SOURCE_FRAME)]},
     })
+    return f"/frame/{pause_id}/0"
 
-    response = server.test_client().get(f"/frame/{pause_id}/0")
-    assert response.status_code == 200
-    assert b"<html" in response.data.lower()
-    assert b"test_breakpoint_server.py" in response.data
-
-
-def test_frame_endpoint_returns_404_when_pause_missing(server) -> None:
-    """Test /frame returns 404 when pause id is unknown."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    response = server.test_client().get("/frame/not-a-real-pause/0")
-    assert response.status_code == 404
-
-
-def test_frame_endpoint_renders_source_for_call_record(server) -> None:
-    """Test GET /frame/call/<process_key>/<call_id>/<frame_index> endpoint."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
 
+def _frame_url_for_call_record(server: BreakpointServer) -> str:
     process_pid = 9999
     process_start_time = 1234.567
-    process_key = f"{process_start_time:.6f}+{process_pid}"
-    call_id = "call-1"
-
-    server.manager.record_call({
-        "call_id": call_id,
-        "method_name": "noop",
-        "status": "success",
-        "pretty_args": [],
-        "pretty_kwargs": {},
-        "signature": None,
-        "call_site": {
-            "timestamp": 1.0,
-            "stack_trace": [
-                {
-                    "filename": __file__,
-                    "lineno": 1,
-                    "function": "test_frame_endpoint_renders_source_for_call_record",
-                    "code_context": "def test_frame_endpoint_renders_source_for_call_record(server) -> None:",
-                }
-            ],
-        },
-        "process_pid": process_pid,
-        "process_start_time": process_start_time,
-        "process_key": process_key,
-        "started_at": 1.0,
-        "completed_at": 1.0,
-    })
-
-    response = server.test_client().get(f"/frame/call/{process_key}/{call_id}/0")
+    process_key = make_process_key(process_pid, process_start_time)
+    server.manager.record_call(_call_record(
+        call_id="call-1",
+        call_site={"timestamp": 1.0, "stack_trace": [dict(_SOURCE_FRAME)]},
+        process_pid=process_pid,
+        process_start_time=process_start_time,
+        process_key=process_key,
+    ))
+    return f"/frame/call/{process_key}/call-1/0"
+
+
+@pytest.mark.parametrize(
+    "record_frame",
+    [
+        pytest.param(_frame_url_for_paused_execution, id="paused-execution"),
+        pytest.param(_frame_url_for_call_record, id="call-record"),
+    ],
+)
+def test_frame_endpoint_renders_source(
+    server, client, record_frame: Callable[[BreakpointServer], str]
+) -> None:
+    """Test GET /frame/<pause_id>/<i> and /frame/call/<process_key>/<call_id>/<i>."""
+    response = client.get(record_frame(server))
     assert response.status_code == 200
-    assert b"<html" in response.data.lower()
+    assert b"<html" in response.data[:512].lower()
     assert b"test_breakpoint_server.py" in response.data
 
 
-def test_call_tree_stack_trace_frames_link_to_frame_page(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
+def test_frame_endpoint_returns_404_when_pause_missing(client) -> None:
+    """Test /frame returns 404 when pause id is unknown."""
+    response = client.get("/frame/not-a-real-pause/0")
+    assert response.status_code == 404
+
 
+def test_call_tree_stack_trace_frames_link_to_frame_page(server, client) -> None:
     process_pid = 1111
     process_start_time = 2222.333
-    process_key = f"{process_start_time:.6f}+{process_pid}"
+    process_key = make_process_key(process_pid, process_start_time)
 
-    server.manager.record_call({
-        "call_id": "call-link",
-        "method_name": "noop",
-        "status": "success",
-        "pretty_args": [],
-        "pretty_kwargs": {},
-        "signature": None,
-        "call_site": {"timestamp": 1.0, "stack_trace": [{"filename": "app.py", "lineno": 1, "function": "main"}]},
-        "process_pid": process_pid,
-        "process_start_time": process_start_time,
-        "process_key": process_key,
-        "started_at": 1.0,
-        "completed_at": 1.0,
-    })
+    server.manager.record_call(_call_record(
+        call_id="call-link",
+        call_site={
+            "timestamp": 1.0,
+            "stack_trace": [{"filename": "app.py", "lineno": 1, "function": "main"}],
+        },
+        process_pid=process_pid,
+        process_start_time=process_start_time,
+        process_key=process_key,
+    ))
 
-    response = server.test_client().get(f"/call-tree/{process_key}")
+    response = client.get(f"/call-tree/{process_key}")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    assert "/frame/call/" in html
-    assert "stack-frame-link" in html
+    html = response.data
+    assert b"/frame/call/" in html
+    assert b"stack-frame-link" in html
 
 
-def test_call_start_returns_continue_when_no_breakpoint(server) -> None:
+def test_call_start_returns_continue_when_no_breakpoint(client) -> None:
     """Test POST /api/call/start returns continue action."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-    serializer = Serializer()
-    target = {"x": 1}
-    target_payload = serializer.force_serialize_with_data(target)
-
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/start",
-        data=json.dumps({
-            "method_name": "noop",
-            "target": {"cid": target_payload.cid, "data": target_payload.data_base64},
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
+        json=_call_start_payload(
+            target={"cid": _OPAQUE_TARGET.cid, "data": _OPAQUE_TARGET.data_base64},
+            call_site={"timestamp": 123.0},
+        ),
     )
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["action"] == "continue"
 
 
-def test_call_tree_builds_from_outer_to_inner_stack_traces(server) -> None:
+def test_call_tree_builds_from_outer_to_inner_stack_traces(server, client) -> None:
     """Call tree should nest nodes when stack traces are outer-to-inner ordered."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
     process_key = "process-1"
     process_pid = 123
     process_start_time = 1000.0
@@ -1327,91 +1219,94 @@ def test_call_tree_builds_from_outer_to_inner_stack_traces(server) -> None:
     stack_child = stack_root + [frame("app.py", 20, "run_a")]
     stack_grandchild = stack_child + [frame("app.py", 30, "run_b")]
 
-    def record(call_id: str, method_name: str, stack_trace: list[dict[str, object]], ts: float) -> dict[str, object]:
-        return {
-            "call_id": call_id,
-            "method_name": method_name,
-            "status": "success",
-            "pretty_args": [],
-            "pretty_kwargs": {},
-            "signature": None,
-            "call_site": {"timestamp": ts, "stack_trace": stack_trace},
-            "process_pid": process_pid,
-            "process_start_time": process_start_time,
-            "process_key": process_key,
-            "started_at": ts,
-            "completed_at": ts + 0.05,
-        }
-
-    server.manager.record_call(record("call-a", "run_a", stack_root, 1.0))
-    server.manager.record_call(record("call-b", "run_b", stack_child, 2.0))
-    server.manager.record_call(record("call-c", "run_c", stack_grandchild, 3.0))
-
-    response = server.test_client().get(f"/call-tree/{process_key}")
+    def record(
+        call_id: str, method_name: str, stack_trace: list[dict[str, object]], ts: float
+    ) -> dict[str, object]:
+        return _call_record(
+            call_id=call_id,
+            method_name=method_name,
+            call_site={"timestamp": ts, "stack_trace": stack_trace},
+            process_pid=process_pid,
+            process_start_time=process_start_time,
+            process_key=process_key,
+            started_at=ts,
+            completed_at=ts + 0.05,
+        )
+
+    server.manager.record_calls([
+        record("call-a", "run_a", stack_root, 1.0),
+        record("call-b", "run_b", stack_child, 2.0),
+        record("call-c", "run_c", stack_grandchild, 3.0),
+    ])
+
+    response = client.get(f"/call-tree/{process_key}")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
-    match = re.search(r"const data = ({.*?});", html, re.S)
-    assert match, "Expected call tree data to be embedded in HTML."
-    payload = json.loads(match.group(1))
+    html = response.data
+    payload = _embedded_json(html, b"const data = {")
 
     assert payload["roots"] == ["call-a"]
     assert payload["children"]["call-a"] == ["call-b"]
     assert payload["children"]["call-b"] == ["call-c"]
 
 
-def test_call_tree_renders_pretty_args_when_args_missing(server) -> None:
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
+def test_call_tree_renders_pretty_args_when_args_missing(server, client) -> None:
     process_pid = 2468
     process_start_time = 2000.0
-    process_key = f"{process_start_time:.6f}+{process_pid}"
+    process_key = make_process_key(process_pid, process_start_time)
 
-    record = {
-        "call_id": "call-1",
-        "method_name": "with_debug.register",
-        "status": "registered",
-        "pretty_args": [
+    server.manager.record_call(_call_record(
+        call_id="call-1",
+        method_name="with_debug.register",
+        status="registered",
+        pretty_args=[
             {"__cideldill_placeholder__": True, "summary": "asset_tool", "client_ref": 17}
         ],
-        "pretty_kwargs": {},
-        "signature": None,
-        "call_site": {"timestamp": 1.0, "stack_trace": []},
-        "process_pid": process_pid,
-        "process_start_time": process_start_time,
-        "process_key": process_key,
-        "started_at": 1.0,
-        "completed_at": 1.0,
-    }
-    server.manager.record_call(record)
+        process_pid=process_pid,
+        process_start_time=process_start_time,
+        process_key=process_key,
+    ))
 
-    response = server.test_client().get(f"/call-tree/{process_key}")
+    response = client.get(f"/call-tree/{process_key}")
     assert response.status_code == 200
-    html = response.data.decode("utf-8")
+    html = response.data
 
-    match = re.search(r"const data = ({.*?});", html, re.S)
-    assert match, "Expected call tree data to be embedded in HTML."
-    payload = json.loads(match.group(1))
+    payload = _embedded_json(html, b"const data = {")
     assert payload["nodes"][0]["pretty_args"][0]["summary"] == "asset_tool"
     assert payload["nodes"][0]["args"] == []
-    assert "argsSource = argsItems.length ? argsItems : prettyArgs" in html
-    assert "kwargsSource = kwargsEntries.length ? kwargsEntries : Object.entries(prettyKwargs)" in html
+    assert b"argsSource = argsItems.length ? argsItems : prettyArgs" in html
+    assert (
+        b"kwargsSource = kwargsEntries.length ? kwargsEntries : Object.entries(prettyKwargs)"
+        in html
+    )
 
 
-def test_poll_waits_until_resume_action(server) -> None:
+def test_poll_waits_until_resume_action(server, client) -> None:
     """Test /api/poll waits for resume action."""
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
     pause_id = server.manager.add_paused_execution({"method_name": "noop"})
-    response = server.test_client().get(f"/api/poll/{pause_id}")
+    response = client.get(f"/api/poll/{pause_id}")
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data["status"] == "waiting"
 
     server.manager.resume_execution(pause_id, {"action": "continue"})
-    response = server.test_client().get(f"/api/poll/{pause_id}")
-    data = json.loads(response.data)
+    response = client.get(f"/api/poll/{pause_id}")
+    data = response.get_json()
+    assert data["status"] == "ready"
+
+
+def test_poll_with_wait_blocks_until_resume_action(server, client) -> None:
+    """Test /api/poll?wait=... returns once the resume action is stored."""
+    pause_id = server.manager.add_paused_execution({"method_name": "noop"})
+
+    timer = threading.Timer(
+        0.05, server.manager.resume_execution, args=(pause_id, {"action": "continue"})
+    )
+    timer.start()
+    try:
+        response = client.get(f"/api/poll/{pause_id}?wait=5")
+    finally:
+        timer.join()
+
+    data = response.get_json()
     assert data["status"] == "ready"
+    assert data["action"] == {"action": "continue"}
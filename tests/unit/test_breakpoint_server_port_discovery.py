@@ -2,16 +2,14 @@
 
 from __future__ import annotations
 
+import socket
 import tempfile
 import threading
-import time
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
-pytest.importorskip("requests")
-import requests
-
 from cideldill_server.breakpoint_manager import BreakpointManager
 from cideldill_server.breakpoint_server import BreakpointServer
 
@@ -19,16 +17,13 @@ from cideldill_server.breakpoint_server import BreakpointServer
 def _start_server(server: BreakpointServer) -> threading.Thread:
     thread = threading.Thread(target=server.start, daemon=True)
     thread.start()
+    assert server.wait_until_ready(timeout=5.0), "Breakpoint server did not start"
     return thread
 
 
-def _wait_for_port_file(port_file: Path, timeout: float = 5.0) -> int:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if port_file.exists():
-            return int(port_file.read_text())
-        time.sleep(0.1)
-    raise AssertionError("port discovery file not created")
+def _read_port_file(port_file: Path) -> int:
+    # start() writes the discovery file before signalling readiness
+    return int(port_file.read_text())
 
 
 def _stop_server(server: BreakpointServer, thread: threading.Thread) -> None:
@@ -36,17 +31,7 @@ def _stop_server(server: BreakpointServer, thread: threading.Thread) -> None:
     thread.join(timeout=2)
 
 
-def _find_free_port() -> int:
-    import socket
-
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.bind(("127.0.0.1", 0))
-        return int(sock.getsockname()[1])
-
-
 def _skip_if_socket_unavailable() -> None:
-    import socket
-
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
             sock.bind(("127.0.0.1", 0))
@@ -54,6 +39,26 @@ def _skip_if_socket_unavailable() -> None:
         pytest.skip("Socket bind not permitted in this environment")
 
 
+@pytest.fixture
+def reserved_port() -> Iterator[socket.socket]:
+    """Hold an OS-assigned port bound until the test releases it with ``_release_port``."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.bind(("127.0.0.1", 0))
+    except PermissionError:
+        sock.close()
+        pytest.skip("Socket bind not permitted in this environment")
+    yield sock
+    sock.close()
+
+
+def _release_port(reserved: socket.socket) -> int:
+    # Release the reservation only now, just before the server binds it
+    port = int(reserved.getsockname()[1])
+    reserved.close()
+    return port
+
+
 def test_server_writes_port_to_discovery_file() -> None:
     """Test that server writes its port to the discovery file."""
     _skip_if_socket_unavailable()
@@ -64,56 +69,48 @@ def test_server_writes_port_to_discovery_file() -> None:
 
         thread = _start_server(server)
         try:
-            port = _wait_for_port_file(port_file)
+            port = _read_port_file(port_file)
 
             assert 1024 <= port <= 65535
-            response = requests.get(f"http://localhost:{port}/api/breakpoints", timeout=1)
+            response = server.test_client().get("/api/breakpoints")
             assert response.status_code == 200
         finally:
             _stop_server(server, thread)
 
 
-def test_server_uses_specified_port_if_available() -> None:
+def test_server_uses_specified_port_if_available(reserved_port) -> None:
     """Test that server uses specified port if available."""
-    _skip_if_socket_unavailable()
     with tempfile.TemporaryDirectory() as tmpdir:
         port_file = Path(tmpdir) / "port"
         manager = BreakpointManager()
-        try:
-            requested_port = _find_free_port()
-        except PermissionError:
-            pytest.skip("Socket bind not permitted in this environment")
+        requested_port = _release_port(reserved_port)
         server = BreakpointServer(manager, port=requested_port, port_file=port_file)
 
         thread = _start_server(server)
         try:
-            actual_port = _wait_for_port_file(port_file)
+            actual_port = _read_port_file(port_file)
 
             assert actual_port == requested_port
         finally:
             _stop_server(server, thread)
 
 
-def test_server_falls_back_if_port_occupied() -> None:
+def test_server_falls_back_if_port_occupied(reserved_port) -> None:
     """Test that server falls back to free port if requested port is occupied."""
-    _skip_if_socket_unavailable()
     with tempfile.TemporaryDirectory() as tmpdir:
         port_file = Path(tmpdir) / "port"
         port_file2 = Path(tmpdir) / "port2"
         manager1 = BreakpointManager()
         manager2 = BreakpointManager()
 
-        try:
-            requested_port = _find_free_port()
-        except PermissionError:
-            pytest.skip("Socket bind not permitted in this environment")
+        requested_port = _release_port(reserved_port)
         server1 = BreakpointServer(manager1, port=requested_port, port_file=port_file)
         thread1 = _start_server(server1)
         server2 = BreakpointServer(manager2, port=requested_port, port_file=port_file2)
         thread2 = _start_server(server2)
         try:
-            port1 = _wait_for_port_file(port_file)
-            port2 = _wait_for_port_file(port_file2)
+            port1 = _read_port_file(port_file)
+            port2 = _read_port_file(port_file2)
 
             assert port1 == requested_port
             assert port2 != requested_port
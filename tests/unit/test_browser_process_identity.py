@@ -1,39 +1,10 @@
-import json
-import threading
-import time
-
-import pytest
-
-from cideldill_server.breakpoint_manager import BreakpointManager
-from cideldill_server.breakpoint_server import BreakpointServer
-from cideldill_server.serialization import Serializer
-
-
-@pytest.fixture
-def server():
-    manager = BreakpointManager()
-    server = BreakpointServer(manager, port=0)
-    yield server
-    server.stop()
-
-
-def _start_server(server):
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-
-def test_call_start_stores_page_url(server) -> None:
-    _start_server(server)
+def test_call_start_stores_page_url(server, target_payload, client) -> None:
     server.manager.add_breakpoint("add")
     server.manager.set_default_behavior("stop")
 
-    serializer = Serializer()
-    target_payload = serializer.force_serialize_with_data({"x": 1})
-
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/start",
-        data=json.dumps({
+        json={
             "method_name": "add",
             "target": {"cid": target_payload.cid, "data": target_payload.data_base64},
             "args": [],
@@ -42,8 +13,7 @@ def test_call_start_stores_page_url(server) -> None:
             "process_pid": 0,
             "process_start_time": 123.456,
             "page_url": "https://example.com/app",
-        }),
-        content_type="application/json",
+        },
     )
 
     assert response.status_code == 200
@@ -52,19 +22,16 @@ def test_call_start_stores_page_url(server) -> None:
     assert paused[0]["call_data"]["page_url"] == "https://example.com/app"
 
 
-def test_call_event_stores_page_url(server) -> None:
-    _start_server(server)
-
-    response = server.test_client().post(
+def test_call_event_stores_page_url(server, client) -> None:
+    response = client.post(
         "/api/call/event",
-        data=json.dumps({
+        json={
             "event_id": "evt-1",
             "method_name": "event",
             "process_pid": 0,
             "process_start_time": 123.456,
             "page_url": "https://example.com/event",
-        }),
-        content_type="application/json",
+        },
     )
 
     assert response.status_code == 200
@@ -1,22 +1,8 @@
 import json
-import threading
-import time
 import hashlib
 
 import pytest
 
-from cideldill_server.breakpoint_manager import BreakpointManager
-from cideldill_server.breakpoint_server import BreakpointServer
-from cideldill_server.serialization import Serializer
-
-
-@pytest.fixture
-def server():
-    manager = BreakpointManager()
-    server = BreakpointServer(manager, port=0)
-    yield server
-    server.stop()
-
 
 def _json_data_and_cid(value):
     data = json.dumps(value)
@@ -24,199 +10,137 @@ def _json_data_and_cid(value):
     return data, cid
 
 
-def _start_server(server):
-    thread = threading.Thread(target=server.start, daemon=True)
-    thread.start()
-    time.sleep(0.2)
-
-
-def test_call_start_accepts_json_serialization_format(server) -> None:
-    _start_server(server)
-    data, cid = _json_data_and_cid({"x": 1})
-
-    response = server.test_client().post(
+def _post_call_start(client, target, **overrides):
+    """POST /api/call/start for ``add`` on ``target``; overrides replace body fields."""
+    return client.post(
         "/api/call/start",
-        data=json.dumps({
+        json={
             "method_name": "add",
-            "target": {
-                "cid": cid,
-                "data": data,
-                "serialization_format": "json",
-            },
+            "target": target,
             "args": [],
             "kwargs": {},
             "call_site": {"timestamp": 123.0},
             "process_pid": 4242,
             "process_start_time": 123.456,
-        }),
-        content_type="application/json",
+            **overrides,
+        },
+    )
+
+
+def _start_call_id(client, target_payload) -> str:
+    response = _post_call_start(
+        client, {"cid": target_payload.cid, "data": target_payload.data_base64}
+    )
+    return response.get_json()["call_id"]
+
+
+def test_call_start_accepts_json_serialization_format(server, client) -> None:
+    data, cid = _json_data_and_cid({"x": 1})
+
+    response = _post_call_start(
+        client, {"cid": cid, "data": data, "serialization_format": "json"}
     )
 
     assert response.status_code == 200
     assert server._cid_store.get(cid) == data.encode("utf-8")
 
 
-def test_call_start_defaults_to_dill_when_format_absent(server) -> None:
-    _start_server(server)
-    serializer = Serializer()
-    target_payload = serializer.force_serialize_with_data({"x": 1})
-
-    response = server.test_client().post(
-        "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {"cid": target_payload.cid, "data": target_payload.data_base64},
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
+def test_call_start_defaults_to_dill_when_format_absent(client, target_payload) -> None:
+    response = _post_call_start(
+        client, {"cid": target_payload.cid, "data": target_payload.data_base64}
     )
 
     assert response.status_code == 200
 
 
-def test_call_start_cid_dedup_works_for_json(server) -> None:
-    _start_server(server)
+def test_call_start_cid_dedup_works_for_json(client) -> None:
     data, cid = _json_data_and_cid({"x": 2})
 
-    response = server.test_client().post(
-        "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {"cid": cid, "data": data, "serialization_format": "json"},
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
+    response = _post_call_start(
+        client, {"cid": cid, "data": data, "serialization_format": "json"}
     )
     assert response.status_code == 200
 
-    response = server.test_client().post(
-        "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {"cid": cid, "serialization_format": "json"},
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 124.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
+    response = _post_call_start(
+        client,
+        {"cid": cid, "serialization_format": "json"},
+        call_site={"timestamp": 124.0},
     )
     assert response.status_code == 200
 
 
-def test_call_start_returns_cid_not_found_for_missing_json_data(server) -> None:
-    _start_server(server)
-    _, cid = _json_data_and_cid({"x": 3})
-
-    response = server.test_client().post(
-        "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {"cid": cid, "serialization_format": "json"},
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 125.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
-    )
+@pytest.mark.parametrize(
+    ("target", "expected_error"),
+    [
+        pytest.param(
+            {"cid": _json_data_and_cid({"x": 3})[1], "serialization_format": "json"},
+            "cid_not_found",
+            id="missing_json_data",
+        ),
+        pytest.param(
+            {"cid": "badcid", "data": "not-base64", "serialization_format": "dill"},
+            "invalid_dill",
+            id="invalid_dill",
+        ),
+        pytest.param(
+            {"cid": "badcid", "data": "{bad", "serialization_format": "json"},
+            "invalid_json",
+            id="invalid_json",
+        ),
+    ],
+)
+def test_call_start_rejects_bad_target(client, target, expected_error) -> None:
+    response = _post_call_start(client, target)
 
     assert response.status_code == 400
-    payload = json.loads(response.data)
-    assert payload.get("error") == "cid_not_found"
+    payload = response.get_json()
+    assert payload.get("error") == expected_error
 
 
-def test_call_complete_accepts_json_result_data(server) -> None:
-    _start_server(server)
-    serializer = Serializer()
-    target_payload = serializer.force_serialize_with_data({"x": 1})
+def test_call_complete_accepts_json_result_data(server, client, target_payload) -> None:
     result_data, result_cid = _json_data_and_cid({"answer": 3})
+    call_id = _start_call_id(client, target_payload)
 
-    response = server.test_client().post(
-        "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {"cid": target_payload.cid, "data": target_payload.data_base64},
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
-    )
-    call_id = json.loads(response.data)["call_id"]
-
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/complete",
-        data=json.dumps({
+        json={
             "call_id": call_id,
             "status": "success",
             "result_cid": result_cid,
             "result_data": result_data,
             "result_serialization_format": "json",
-        }),
-        content_type="application/json",
+        },
     )
 
     assert response.status_code == 200
     assert server._cid_store.get(result_cid) == result_data.encode("utf-8")
 
 
-def test_call_complete_accepts_json_exception_data(server) -> None:
-    _start_server(server)
-    serializer = Serializer()
-    target_payload = serializer.force_serialize_with_data({"x": 1})
+def test_call_complete_accepts_json_exception_data(server, client, target_payload) -> None:
     exc_data, exc_cid = _json_data_and_cid({"error": "boom"})
+    call_id = _start_call_id(client, target_payload)
 
-    response = server.test_client().post(
-        "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {"cid": target_payload.cid, "data": target_payload.data_base64},
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
-    )
-    call_id = json.loads(response.data)["call_id"]
-
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/complete",
-        data=json.dumps({
+        json={
             "call_id": call_id,
             "status": "exception",
             "exception_cid": exc_cid,
             "exception_data": exc_data,
             "exception_serialization_format": "json",
-        }),
-        content_type="application/json",
+        },
     )
 
     assert response.status_code == 200
     assert server._cid_store.get(exc_cid) == exc_data.encode("utf-8")
 
 
-def test_call_event_accepts_json_serialization(server) -> None:
-    _start_server(server)
+def test_call_event_accepts_json_serialization(server, client) -> None:
     result_data, result_cid = _json_data_and_cid({"event": "ok"})
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/call/event",
-        data=json.dumps({
+        json={
             "event_id": "evt-1",
             "method_name": "event",
             "process_pid": 4242,
@@ -224,80 +148,25 @@ def test_call_event_accepts_json_serialization(server) -> None:
             "result_cid": result_cid,
             "result_data": result_data,
             "result_serialization_format": "json",
-        }),
-        content_type="application/json",
+        },
     )
 
     assert response.status_code == 200
     assert server._cid_store.get(result_cid) == result_data.encode("utf-8")
 
 
-def test_functions_endpoint_accepts_json_serialization(server) -> None:
-    _start_server(server)
+def test_functions_endpoint_accepts_json_serialization(server, client) -> None:
     function_data, function_cid = _json_data_and_cid({"name": "myFn"})
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/functions",
-        data=json.dumps({
+        json={
             "function_name": "myFn",
             "function_cid": function_cid,
             "function_data": function_data,
             "function_serialization_format": "json",
-        }),
-        content_type="application/json",
+        },
     )
 
     assert response.status_code == 200
     assert server._cid_store.get(function_cid) == function_data.encode("utf-8")
-
-
-def test_call_start_rejects_invalid_dill_payload(server) -> None:
-    _start_server(server)
-
-    response = server.test_client().post(
-        "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {
-                "cid": "badcid",
-                "data": "not-base64",
-                "serialization_format": "dill",
-            },
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 400
-    payload = json.loads(response.data)
-    assert payload.get("error") == "invalid_dill"
-
-
-def test_call_start_rejects_invalid_json_payload(server) -> None:
-    _start_server(server)
-
-    response = server.test_client().post(
-        "/api/call/start",
-        data=json.dumps({
-            "method_name": "add",
-            "target": {
-                "cid": "badcid",
-                "data": "{bad",
-                "serialization_format": "json",
-            },
-            "args": [],
-            "kwargs": {},
-            "call_site": {"timestamp": 123.0},
-            "process_pid": 4242,
-            "process_start_time": 123.456,
-        }),
-        content_type="application/json",
-    )
-
-    assert response.status_code == 400
-    payload = json.loads(response.data)
-    assert payload.get("error") == "invalid_json"
@@ -42,3 +42,15 @@ def test_stats_reports_counts_and_size() -> None:
     stats = store.stats()
     assert stats["count"] == 2
     assert stats["total_size_bytes"] >= len(data_one) + len(data_two)
+
+
+def test_clear_removes_all_entries() -> None:
+    store = CIDStore()
+    data = b"one"
+    cid = hashlib.sha512(data).hexdigest()
+    store.store(cid, data)
+
+    store.clear()
+
+    assert store.get(cid) is None
+    assert store.stats()["count"] == 0
@@ -76,3 +76,24 @@ def test_serialization_error_event_sends_placeholder(monkeypatch) -> None:
     assert payload["exception"]["object_name"] == "UnpicklableContainer"
     restored = client._serializer.deserialize_base64(payload["exception_data"])
     assert isinstance(restored, UnpicklablePlaceholder)
+
+
+def test_clearing_serialization_error_reporter_stops_reports(monkeypatch) -> None:
+    posted: list[dict] = []
+
+    def fake_post(url: str, json: dict, timeout: float) -> _Response:
+        posted.append(json)
+        return _Response(200, {"status": "ok"})
+
+    monkeypatch.setattr("requests.post", fake_post)
+
+    client = DebugClient("http://example.test")
+    client.enable_events()
+    client._serializer.serialize(UnpicklableContainer())
+    assert posted
+
+    posted.clear()
+    set_serialization_error_reporter(None)
+    client._serializer.serialize(UnpicklableContainer())
+
+    assert posted == []
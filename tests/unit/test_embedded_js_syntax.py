@@ -7,12 +7,12 @@ import re
 import shutil
 import subprocess
 import threading
-import time
 
 import pytest
 
 from cideldill_server.breakpoint_manager import BreakpointManager
 from cideldill_server.breakpoint_server import BreakpointServer
+from cideldill_server.process_key import make_process_key
 
 
 @pytest.fixture
@@ -43,11 +43,11 @@ def _assert_js_parses(source: str) -> None:
 def test_embedded_js_is_valid(server: BreakpointServer) -> None:
     thread = threading.Thread(target=server.start, daemon=True)
     thread.start()
-    time.sleep(0.2)
+    assert server.wait_until_ready(timeout=2.0), "Breakpoint server did not start"
 
     process_pid = 1234
     process_start_time = 456.789
-    process_key = f"{process_start_time:.6f}+{process_pid}"
+    process_key = make_process_key(process_pid, process_start_time)
     server.manager.record_call({
         "call_id": "call-1",
         "method_name": "noop",
@@ -0,0 +1,62 @@
+"""Unit tests for the orjson-backed Flask JSON provider."""
+
+from __future__ import annotations
+
+import datetime
+import math
+
+import pytest
+
+pytest.importorskip("orjson")
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from cideldill_server.json_provider import OrjsonProvider
+
+
+@pytest.fixture(scope="module")
+def providers() -> tuple[OrjsonProvider, DefaultJSONProvider]:
+    app = Flask(__name__)
+    return OrjsonProvider(app), DefaultJSONProvider(app)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param({"b": 1, "a": [1, 2.5, None, True]}, id="sorted_keys"),
+        pytest.param({2: "two", 1: "one"}, id="int_keys"),
+        pytest.param(datetime.date(2024, 1, 2), id="date_uses_flask_default"),
+    ],
+)
+def test_dumps_matches_default_provider(providers, value) -> None:
+    """Test that orjson output decodes to what the stdlib provider produces."""
+    orjson_provider, default_provider = providers
+    assert default_provider.loads(orjson_provider.dumps(value)) == default_provider.loads(
+        default_provider.dumps(value)
+    )
+
+
+def test_dumps_falls_back_for_wide_integers(providers) -> None:
+    """Test that integers orjson cannot encode go through the stdlib."""
+    orjson_provider, _default_provider = providers
+    assert orjson_provider.dumps({"n": 2**70}) == '{"n": 1180591620717411303424}'
+
+
+def test_loads_falls_back_for_nan_literals(providers) -> None:
+    """Test that NaN literals sent by Python clients still decode."""
+    orjson_provider, _default_provider = providers
+    assert math.isnan(orjson_provider.loads('{"x": NaN}')["x"])
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf], ids=["nan", "inf", "-inf"])
+def test_non_finite_floats_encode_as_null(providers, value) -> None:
+    """Test that NaN and Infinity are written as null, which browsers can parse."""
+    orjson_provider, _default_provider = providers
+    assert orjson_provider.loads(orjson_provider.dumps({"x": [value]})) == {"x": [None]}
+
+
+def test_loads_rejects_invalid_json(providers) -> None:
+    """Test that malformed documents still raise a JSON decode error."""
+    orjson_provider, _default_provider = providers
+    with pytest.raises(ValueError):
+        orjson_provider.loads("{not json")
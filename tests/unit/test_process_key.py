@@ -0,0 +1,13 @@
+"""Unit tests for process key formatting."""
+
+from __future__ import annotations
+
+from cideldill_server.process_key import make_process_key
+
+
+def test_make_process_key_formats_start_time_and_pid() -> None:
+    assert make_process_key(4242, 123.456) == "123.456000+4242"
+
+
+def test_make_process_key_pads_start_time_to_microseconds() -> None:
+    assert make_process_key(1, 2.5) == "2.500000+1"
@@ -30,21 +30,20 @@ def _pause_call_data(pid: int = 5555) -> dict[str, object]:
     }
 
 
-def test_post_repl_start_creates_session(server) -> None:
+def test_post_repl_start_creates_session(server, client) -> None:
     pause_id = server.manager.add_paused_execution(_pause_call_data())
 
-    response = server.test_client().post(
+    response = client.post(
         "/api/repl/start",
-        data=json.dumps({"pause_id": pause_id}),
-        content_type="application/json",
+        json={"pause_id": pause_id},
     )
 
     assert response.status_code == 200
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert "session_id" in payload
 
 
-def test_poll_repl_returns_pending_eval_request(server) -> None:
+def test_poll_repl_returns_pending_eval_request(server, client) -> None:
     pause_id = server.manager.add_paused_execution(_pause_call_data())
     session_id = server.manager.start_repl_session(pause_id)
 
@@ -54,18 +53,17 @@ def test_poll_repl_returns_pending_eval_request(server) -> None:
         nonlocal eval_response
         resp = server.test_client().post(
             f"/api/repl/{session_id}/eval",
-            data=json.dumps({"expr": "1 + 1"}),
-            content_type="application/json",
+            json={"expr": "1 + 1"},
         )
-        eval_response = {"status": resp.status_code, "data": json.loads(resp.data)}
+        eval_response = {"status": resp.status_code, "data": resp.get_json()}
 
     thread = threading.Thread(target=_post_eval)
     thread.start()
     time.sleep(0.1)
 
-    poll = server.test_client().get(f"/api/poll-repl/{pause_id}")
+    poll = client.get(f"/api/poll-repl/{pause_id}")
     assert poll.status_code == 200
-    poll_payload = json.loads(poll.data)
+    poll_payload = poll.get_json()
     assert poll_payload["eval_id"] is not None
     assert poll_payload["session_id"] == session_id
     assert poll_payload["expr"] == "1 + 1"
@@ -80,10 +78,9 @@ def test_poll_repl_returns_pending_eval_request(server) -> None:
         "result_cid": None,
         "result_data": None,
     }
-    result = server.test_client().post(
+    result = client.post(
         "/api/call/repl-result",
-        data=json.dumps(result_payload),
-        content_type="application/json",
+        json=result_payload,
     )
     assert result.status_code == 200
 
@@ -93,7 +90,7 @@ def test_poll_repl_returns_pending_eval_request(server) -> None:
     assert eval_response["data"]["is_error"] is False
 
 
-def test_repl_result_accepts_json_payload(server) -> None:
+def test_repl_result_accepts_json_payload(server, client) -> None:
     pause_id = server.manager.add_paused_execution(_pause_call_data())
     session_id = server.manager.start_repl_session(pause_id)
 
@@ -103,17 +100,16 @@ def test_repl_result_accepts_json_payload(server) -> None:
         nonlocal eval_response
         resp = server.test_client().post(
             f"/api/repl/{session_id}/eval",
-            data=json.dumps({"expr": "1 + 1"}),
-            content_type="application/json",
+            json={"expr": "1 + 1"},
         )
-        eval_response = {"status": resp.status_code, "data": json.loads(resp.data)}
+        eval_response = {"status": resp.status_code, "data": resp.get_json()}
 
     thread = threading.Thread(target=_post_eval)
     thread.start()
     time.sleep(0.1)
 
-    poll = server.test_client().get(f"/api/poll-repl/{pause_id}")
-    poll_payload = json.loads(poll.data)
+    poll = client.get(f"/api/poll-repl/{pause_id}")
+    poll_payload = poll.get_json()
 
     result_data = json.dumps(3)
     result_cid = hashlib.sha512(result_data.encode("utf-8")).hexdigest()
@@ -125,10 +121,9 @@ def test_repl_result_accepts_json_payload(server) -> None:
         "result_data": result_data,
         "result_serialization_format": "json",
     }
-    result = server.test_client().post(
+    result = client.post(
         "/api/call/repl-result",
-        data=json.dumps(result_payload),
-        content_type="application/json",
+        json=result_payload,
     )
     assert result.status_code == 200
 
@@ -138,29 +133,28 @@ def test_repl_result_accepts_json_payload(server) -> None:
     assert eval_response["data"]["is_error"] is False
 
 
-def test_poll_repl_returns_null_when_no_requests(server) -> None:
+def test_poll_repl_returns_null_when_no_requests(server, client) -> None:
     pause_id = server.manager.add_paused_execution(_pause_call_data())
 
-    response = server.test_client().get(f"/api/poll-repl/{pause_id}")
+    response = client.get(f"/api/poll-repl/{pause_id}")
     assert response.status_code == 200
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert payload["eval_id"] is None
 
 
-def test_repl_eval_timeout_returns_504(server) -> None:
+def test_repl_eval_timeout_returns_504(server, client) -> None:
     pause_id = server.manager.add_paused_execution(_pause_call_data())
     session_id = server.manager.start_repl_session(pause_id)
 
-    response = server.test_client().post(
+    response = client.post(
         f"/api/repl/{session_id}/eval",
-        data=json.dumps({"expr": "1 + 1"}),
-        content_type="application/json",
+        json={"expr": "1 + 1"},
     )
 
     assert response.status_code == 504
 
 
-def test_poll_repl_response_includes_pause_id(server) -> None:
+def test_poll_repl_response_includes_pause_id(server, client) -> None:
     """The poll-repl response must include pause_id so the JS client can
     include it when posting results to /api/call/repl-result."""
     pause_id = server.manager.add_paused_execution(_pause_call_data())
@@ -170,29 +164,27 @@ def test_poll_repl_response_includes_pause_id(server) -> None:
     def _post_eval() -> None:
         server.test_client().post(
             f"/api/repl/{session_id}/eval",
-            data=json.dumps({"expr": "x + 1"}),
-            content_type="application/json",
+            json={"expr": "x + 1"},
         )
 
     thread = threading.Thread(target=_post_eval)
     thread.start()
     time.sleep(0.1)
 
-    poll = server.test_client().get(f"/api/poll-repl/{pause_id}")
+    poll = client.get(f"/api/poll-repl/{pause_id}")
     assert poll.status_code == 200
-    poll_payload = json.loads(poll.data)
+    poll_payload = poll.get_json()
     assert poll_payload["eval_id"] is not None
     assert poll_payload["pause_id"] == pause_id
 
     # Clean up: post a result so the eval thread unblocks
-    server.test_client().post(
+    client.post(
         "/api/call/repl-result",
-        data=json.dumps({
+        json={
             "eval_id": poll_payload["eval_id"],
             "pause_id": pause_id,
             "session_id": session_id,
             "result": "42",
-        }),
-        content_type="application/json",
+        },
     )
     thread.join(timeout=2.0)
@@ -1,18 +1,5 @@
 """Unit tests for REPL HTML pages."""
 
-import pytest
-
-from cideldill_server.breakpoint_manager import BreakpointManager
-from cideldill_server.breakpoint_server import BreakpointServer
-
-
-@pytest.fixture
-def server():
-    manager = BreakpointManager()
-    server = BreakpointServer(manager, port=0)
-    yield server
-    server.stop()
-
 
 def _pause_call_data() -> dict[str, object]:
     return {
@@ -34,37 +21,37 @@ def _pause_call_data() -> dict[str, object]:
     }
 
 
-def test_callstack_page_renders(server) -> None:
+def test_callstack_page_renders(server, client) -> None:
     pause_id = server.manager.add_paused_execution(_pause_call_data())
 
-    response = server.test_client().get(f"/callstack/{pause_id}")
+    response = client.get(f"/callstack/{pause_id}")
     assert response.status_code == 200
     html = response.data.decode("utf-8")
     assert "Call Stack" in html
     assert "demo" in html
 
 
-def test_callstack_page_returns_404(server) -> None:
-    response = server.test_client().get("/callstack/missing")
+def test_callstack_page_returns_404(client) -> None:
+    response = client.get("/callstack/missing")
     assert response.status_code == 404
 
 
-def test_repl_page_renders_for_session(server) -> None:
+def test_repl_page_renders_for_session(server, client) -> None:
     pause_id = server.manager.add_paused_execution(_pause_call_data())
     session_id = server.manager.start_repl_session(pause_id)
 
-    response = server.test_client().get(f"/repl/{session_id}")
+    response = client.get(f"/repl/{session_id}")
     assert response.status_code == 200
     assert session_id.encode("utf-8") in response.data
 
 
-def test_repls_page_renders(server) -> None:
-    response = server.test_client().get("/repls")
+def test_repls_page_renders(client) -> None:
+    response = client.get("/repls")
     assert response.status_code == 200
     assert b"REPL Sessions" in response.data
 
 
-def test_call_tree_shows_repl_badge(server) -> None:
+def test_call_tree_shows_repl_badge(server, client) -> None:
     process_key = "10.000000+123"
     server.manager.record_call({
         "call_id": "call-1",
@@ -82,6 +69,6 @@ def test_call_tree_shows_repl_badge(server) -> None:
         "repl_sessions": ["123-1.000000"],
     })
 
-    response = server.test_client().get(f"/call-tree/{process_key}")
+    response = client.get(f"/call-tree/{process_key}")
     assert response.status_code == 200
     assert b"REPL" in response.data
@@ -11,38 +11,22 @@ Verifies that the server's /api/call/complete endpoint:
 
 from __future__ import annotations
 
-import json
-import threading
-import time
-
 import pytest
 
 pytest.importorskip("dill")
 
-from cideldill_server.breakpoint_manager import BreakpointManager
-from cideldill_server.breakpoint_server import BreakpointServer
-
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def server():
-    """Create a test server instance."""
-    manager = BreakpointManager()
-    server = BreakpointServer(manager, port=0)
-    yield server
-    server.stop()
-
-
 def _start_call(server, method_name="my_tool.ainvoke"):
     """Start a call and return the call_id."""
     client = server.test_client()
     response = client.post(
         "/api/call/start",
-        data=json.dumps({
+        json={
             "method_name": method_name,
             "args": [],
             "kwargs": {},
@@ -50,11 +34,10 @@ def _start_call(server, method_name="my_tool.ainvoke"):
             "call_type": "proxy",
             "process_pid": 1234,
             "process_start_time": 999.0,
-        }),
-        content_type="application/json",
+        },
     )
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     call_id = data.get("call_id")
     assert call_id is not None
     return call_id
@@ -76,7 +59,7 @@ def _complete_call_with_exception(
     client = server.test_client()
     response = client.post(
         "/api/call/complete",
-        data=json.dumps({
+        json={
             "call_id": call_id,
             "status": "exception",
             "timestamp": 1001.0,
@@ -85,8 +68,7 @@ def _complete_call_with_exception(
             "exception_type": exception_type,
             "exception_message": exception_message,
             "exception_traceback": exception_traceback,
-        }),
-        content_type="application/json",
+        },
     )
     assert response.status_code == 200
     return response
@@ -104,10 +86,6 @@ class TestServerStoresExceptionFields:
 
     def test_call_record_contains_exception_type(self, server) -> None:
         """Plain-text exception_type sent by client must appear in the call record."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(server, call_id)
 
@@ -118,10 +96,6 @@ class TestServerStoresExceptionFields:
 
     def test_call_record_contains_exception_message(self, server) -> None:
         """Plain-text exception_message sent by client must appear in the call record."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(server, call_id)
 
@@ -132,10 +106,6 @@ class TestServerStoresExceptionFields:
 
     def test_call_record_contains_exception_traceback(self, server) -> None:
         """Plain-text exception_traceback sent by client must appear in the call record."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(server, call_id)
 
@@ -153,12 +123,8 @@ class TestServerStoresExceptionFields:
 class TestExceptionSearchable:
     """Searching the call tree for exception details must find the exception."""
 
-    def test_exception_type_searchable_in_call_tree(self, server) -> None:
+    def test_exception_type_searchable_in_call_tree(self, server, client) -> None:
         """Searching the call-tree detail for 'psycopg2' must find the exception."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(server, call_id)
 
@@ -168,7 +134,6 @@ class TestExceptionSearchable:
         process_key = records[0]["process_key"]
 
         # Fetch the call-tree detail page
-        client = server.test_client()
         resp = client.get(f"/call-tree/{process_key}")
         assert resp.status_code == 200
         html_text = resp.data.decode("utf-8")
@@ -176,19 +141,14 @@ class TestExceptionSearchable:
         # The exception type must be in the page's search-indexable data
         assert "psycopg2" in html_text.lower()
 
-    def test_exception_traceback_searchable_in_call_tree(self, server) -> None:
+    def test_exception_traceback_searchable_in_call_tree(self, server, client) -> None:
         """The traceback text must be present in the call-tree page data."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(server, call_id)
 
         records = server.manager.get_call_records()
         process_key = records[0]["process_key"]
 
-        client = server.test_client()
         resp = client.get(f"/call-tree/{process_key}")
         assert resp.status_code == 200
         html_text = resp.data.decode("utf-8")
@@ -210,10 +170,6 @@ class TestExceptionFallbackWithoutDill:
     def test_exception_field_constructed_from_plain_text(self, server) -> None:
         """call_record['exception'] should be constructed from plain-text
         fields when no exception_cid is provided."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(
             server,
@@ -244,20 +200,15 @@ class TestCallTreeDetailExceptionDisplay:
     """The call-tree detail page must render exception type, message,
     and traceback in a human-readable way — not as raw JSON."""
 
-    def test_exception_summary_visible_in_call_tree_detail(self, server) -> None:
+    def test_exception_summary_visible_in_call_tree_detail(self, server, client) -> None:
         """The call-tree detail page's formatPretty JS function must handle
         __cideldill_exception__ objects to produce a human-readable summary."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(server, call_id)
 
         records = server.manager.get_call_records()
         process_key = records[0]["process_key"]
 
-        client = server.test_client()
         resp = client.get(f"/call-tree/{process_key}")
         assert resp.status_code == 200
         html = resp.data.decode("utf-8")
@@ -266,20 +217,15 @@ class TestCallTreeDetailExceptionDisplay:
         # handling so that exception summary is rendered, not raw JSON
         assert "value.__cideldill_exception__" in html
 
-    def test_traceback_rendered_in_call_tree_node_detail(self, server) -> None:
+    def test_traceback_rendered_in_call_tree_node_detail(self, server, client) -> None:
         """The traceback should be rendered in the node detail panel
         of the call-tree page."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(server, call_id)
 
         records = server.manager.get_call_records()
         process_key = records[0]["process_key"]
 
-        client = server.test_client()
         resp = client.get(f"/call-tree/{process_key}")
         assert resp.status_code == 200
         html = resp.data.decode("utf-8")
@@ -297,14 +243,9 @@ class TestDashboardExceptionDisplay:
     """The main dashboard's formatPretty must handle __cideldill_exception__
     objects so paused-on-exception cards show readable text."""
 
-    def test_dashboard_formatPretty_handles_exception_objects(self, server) -> None:
+    def test_dashboard_formatPretty_handles_exception_objects(self, client) -> None:
         """The main dashboard formatPretty JS function must recognize
         __cideldill_exception__ objects and return the summary."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
-        client = server.test_client()
         resp = client.get("/")
         assert resp.status_code == 200
         html = resp.data.decode("utf-8")
@@ -322,13 +263,9 @@ class TestBreakpointHistoryDetailExceptionDisplay:
     """The breakpoint history detail page must render exception info
     in a human-readable format, not as raw JSON."""
 
-    def test_format_pretty_for_html_renders_exception_summary(self, server) -> None:
+    def test_format_pretty_for_html_renders_exception_summary(self, server, client) -> None:
         """_format_pretty_for_html should produce a human-readable string
         for __cideldill_exception__ dicts, not raw JSON."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         # Set up a breakpoint so execution recording happens
         server.manager.add_breakpoint("my_tool.ainvoke")
         server.manager.set_default_behavior("go")
@@ -347,7 +284,6 @@ class TestBreakpointHistoryDetailExceptionDisplay:
         assert len(records) >= 1
         record_id = records[0].get("id", "0")
 
-        client = server.test_client()
         resp = client.get(f"/breakpoint/my_tool.ainvoke/history/{record_id}")
         assert resp.status_code == 200
         html = resp.data.decode("utf-8")
@@ -380,26 +316,17 @@ class TestTracebackSourceLinks:
     """Exception tracebacks should be parsed and rendered with clickable
     links to /frame/source pages, matching the existing stack trace style."""
 
-    def test_frame_source_route_exists(self, server) -> None:
+    def test_frame_source_route_exists(self, client) -> None:
         """A /frame/source route must exist to render source by file+line."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
-        client = server.test_client()
         # Request a non-existent file — should return 404, not 405 (method not allowed)
         resp = client.get("/frame/source?file=/nonexistent.py&line=1")
         assert resp.status_code in (200, 404), (
             f"Expected 200 or 404, got {resp.status_code}"
         )
 
-    def test_call_tree_has_traceback_parser_js(self, server) -> None:
+    def test_call_tree_has_traceback_parser_js(self, server, client) -> None:
         """The call-tree detail page must include JS that parses Python
         tracebacks into structured frames with clickable links."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(
             server, call_id, exception_traceback=SAMPLE_TRACEBACK,
@@ -408,7 +335,6 @@ class TestTracebackSourceLinks:
         records = server.manager.get_call_records()
         process_key = records[0]["process_key"]
 
-        client = server.test_client()
         resp = client.get(f"/call-tree/{process_key}")
         assert resp.status_code == 200
         html = resp.data.decode("utf-8")
@@ -416,12 +342,8 @@ class TestTracebackSourceLinks:
         # Must contain a function that parses traceback text into frames
         assert "renderTraceback" in html or "parseTraceback" in html
 
-    def test_call_tree_traceback_contains_frame_links(self, server) -> None:
+    def test_call_tree_traceback_contains_frame_links(self, server, client) -> None:
         """The rendered traceback should link to /frame/source pages."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
         call_id = _start_call(server)
         _complete_call_with_exception(
             server, call_id, exception_traceback=SAMPLE_TRACEBACK,
@@ -430,7 +352,6 @@ class TestTracebackSourceLinks:
         records = server.manager.get_call_records()
         process_key = records[0]["process_key"]
 
-        client = server.test_client()
         resp = client.get(f"/call-tree/{process_key}")
         assert resp.status_code == 200
         html = resp.data.decode("utf-8")
@@ -438,13 +359,8 @@ class TestTracebackSourceLinks:
         # The JS rendering code must reference /frame/source for traceback links
         assert "/frame/source" in html
 
-    def test_dashboard_traceback_contains_frame_links(self, server) -> None:
+    def test_dashboard_traceback_contains_frame_links(self, client) -> None:
         """The dashboard renderException should also link traceback frames."""
-        thread = threading.Thread(target=server.start, daemon=True)
-        thread.start()
-        time.sleep(0.2)
-
-        client = server.test_client()
         resp = client.get("/")
         assert resp.status_code == 200
         html = resp.data.decode("utf-8")